@@ -11,12 +11,35 @@ import os
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library serializer
+    orjson = None
+
 # Add the project root to the Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from static_analysis.static_checker import StaticChecker
 from policy_compliance.compliance_checker import ComplianceChecker
 from dynamic_provisioning.dynamic_tester import DynamicTester
+from framework_utils import utc_timestamp
+
+
+def _write_json(output_file: str, data: dict):
+    """
+    Write results as indented JSON, using orjson when it is installed
+    
+    Args:
+        output_file: Path of the JSON file
+        data: Results to serialize
+    """
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(data, f, indent=2)
+
 
 class ComprehensiveTestRunner:
     """
@@ -42,8 +65,7 @@ class ComprehensiveTestRunner:
         results["execution_time"] = execution_time
         
         if output_file:
-            with open(output_file, 'w') as f:
-                json.dump(results, f, indent=2)
+            _write_json(output_file, results)
             print(f"✅ Static analysis results saved to: {output_file}")
         
         return results
@@ -68,11 +90,10 @@ class ComprehensiveTestRunner:
         execution_time = (end_time - start_time).total_seconds()
         results["execution_time"] = execution_time
         results["terraform_directory"] = terraform_dir
-        results["analysis_timestamp"] = start_time.isoformat()
+        results["analysis_timestamp"] = utc_timestamp(start_time)
         
         if output_file:
-            with open(output_file, 'w') as f:
-                json.dump(results, f, indent=2)
+            _write_json(output_file, results)
             print(f"✅ Policy compliance results saved to: {output_file}")
         
         return results
@@ -123,11 +144,10 @@ class ComprehensiveTestRunner:
         execution_time = (end_time - start_time).total_seconds()
         results["execution_time"] = execution_time
         results["terraform_directory"] = terraform_dir
-        results["analysis_timestamp"] = start_time.isoformat()
+        results["analysis_timestamp"] = utc_timestamp(start_time)
         
         if output_file:
-            with open(output_file, 'w') as f:
-                json.dump(results, f, indent=2)
+            _write_json(output_file, results)
             print(f"✅ Dynamic testing results saved to: {output_file}")
         
         return results
@@ -153,7 +173,7 @@ class ComprehensiveTestRunner:
         
         # Combine results
         combined_results = {
-            "analysis_timestamp": start_time.isoformat(),
+            "analysis_timestamp": utc_timestamp(start_time),
             "terraform_directory": terraform_dir,
             "analysis_type": "comprehensive" if include_dynamic else "static_and_compliance",
             "execution_time": (datetime.now() - start_time).total_seconds(),
@@ -166,8 +186,7 @@ class ComprehensiveTestRunner:
             combined_results["dynamic_testing"] = dynamic_results
         
         if output_file:
-            with open(output_file, 'w') as f:
-                json.dump(combined_results, f, indent=2)
+            _write_json(output_file, combined_results)
             print(f"✅ Comprehensive results saved to: {output_file}")
         
         return combined_results
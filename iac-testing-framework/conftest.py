@@ -0,0 +1,57 @@
+# Pytest configuration for the IaC Testing Framework tests
+# The unittest suite in test_framework.py also runs in parallel under
+# pytest-xdist: pytest -n auto test_framework.py
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_examples_dir(tmp_path_factory):
+    """
+    Give each test session its own copy of the Terraform examples
+    
+    Every xdist worker runs its own session, so workers never share the
+    .terraform directory that terraform init writes next to the examples.
+    
+    Yields:
+        Path of the copied examples directory
+    """
+    source = Path(__file__).parent / "static_analysis" / "examples"
+    target = tmp_path_factory.mktemp("terraform") / "examples"
+    shutil.copytree(source, target, ignore=shutil.ignore_patterns('.terraform'))
+    
+    previous = os.environ.get("IAC_TEST_EXAMPLES_DIR")
+    os.environ["IAC_TEST_EXAMPLES_DIR"] = str(target)
+    yield target
+    
+    if previous is None:
+        os.environ.pop("IAC_TEST_EXAMPLES_DIR", None)
+    else:
+        os.environ["IAC_TEST_EXAMPLES_DIR"] = previous
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_cache_dir(tmp_path_factory):
+    """
+    Point the result and policy caches at a per-session directory
+    
+    Checkers built with their default caches then never read or write
+    entries under the user's ~/.cache/iac-framework.
+    
+    Yields:
+        Path of the session cache directory
+    """
+    target = tmp_path_factory.mktemp("cache")
+    
+    previous = os.environ.get("XDG_CACHE_HOME")
+    os.environ["XDG_CACHE_HOME"] = str(target)
+    yield target
+    
+    if previous is None:
+        os.environ.pop("XDG_CACHE_HOME", None)
+    else:
+        os.environ["XDG_CACHE_HOME"] = previous
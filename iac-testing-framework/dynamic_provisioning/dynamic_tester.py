@@ -5,15 +5,22 @@ This module deploys Terraform infrastructure to test environments and validates
 """
 
 import os
+import sys
 import json
 import subprocess
 import time
 import boto3
 import logging
 from typing import Dict, List, Any, Optional
-from datetime import datetime
 from pathlib import Path
 
+# Add the project root to the Python path so the module also runs as a script
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from framework_utils import utc_timestamp
+
 class DynamicTester:
     """
     Handles dynamic provisioning and runtime testing of Terraform infrastructure
@@ -91,7 +98,7 @@ class DynamicTester:
         result = {
             "status": "unknown",
             "terraform_directory": terraform_dir,
-            "deployment_timestamp": datetime.now().isoformat(),
+            "deployment_timestamp": utc_timestamp(),
             "environment": self.test_environment,
             "deployment_time": 0,
             "resources_created": [],
@@ -161,7 +168,7 @@ class DynamicTester:
         
         result = {
             "status": "unknown",
-            "test_timestamp": datetime.now().isoformat(),
+            "test_timestamp": utc_timestamp(),
             "total_tests": 0,
             "passed_tests": 0,
             "failed_tests": 0,
@@ -424,7 +431,7 @@ class DynamicTester:
         
         result = {
             "status": "unknown",
-            "cleanup_timestamp": datetime.now().isoformat(),
+            "cleanup_timestamp": utc_timestamp(),
             "errors": []
         }
         
@@ -0,0 +1,58 @@
+# Helpers shared by the IaC Testing Framework checkers and runners
+# This module is imported from the project root, which every entry point and
+# checker module puts on the Python path
+
+import os
+from datetime import datetime, timezone
+from typing import AbstractSet, Iterator, Optional, Tuple
+
+# Terraform configuration file suffixes; state, backup and lock files never match
+TF_SUFFIXES = ('.tf', '.tf.json')
+
+# Directories that never contain analysable Terraform sources
+SKIP_DIRS = frozenset({'.terraform', '.git', 'node_modules', '.terragrunt-cache'})
+
+
+def iter_terraform_files(dirpath: str, suffixes: Tuple[str, ...] = TF_SUFFIXES,
+                         skip_dirs: AbstractSet[str] = SKIP_DIRS) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield directory entries for Terraform files under a directory
+    
+    Provider caches, VCS metadata and other tool directories are pruned. The
+    DirEntry objects are passed through so callers can reuse their cached
+    stat results.
+    
+    Args:
+        dirpath: Directory to scan
+        suffixes: File name suffixes to yield
+        skip_dirs: Directory names that are not descended into
+        
+    Yields:
+        Directory entries of matching files
+    """
+    with os.scandir(dirpath) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in skip_dirs:
+                    yield from iter_terraform_files(entry.path, suffixes, skip_dirs)
+            elif entry.name.endswith(suffixes) and entry.is_file():
+                yield entry
+
+
+def utc_timestamp(moment: Optional[datetime] = None) -> str:
+    """
+    Format a report timestamp as timezone-aware ISO 8601 in UTC
+    
+    Every report uses this format, so timestamps from runners in different
+    time zones compare and sort correctly.
+    
+    Args:
+        moment: Time to format, the current time by default; naive values
+            are taken as local time
+        
+    Returns:
+        ISO 8601 timestamp with a +00:00 offset
+    """
+    if moment is None:
+        moment = datetime.now(timezone.utc)
+    return moment.astimezone(timezone.utc).isoformat()
@@ -3,25 +3,219 @@
 
 import os
 import json
+import hashlib
+import pickle
+import mmap
 import yaml
 import subprocess
 import re
+import socket
+import sys
+import tempfile
+import time
+import http.client
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, FrozenSet, Optional, Pattern, Tuple
+
+# Add the project root to the Python path so framework_utils imports from any working directory
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from framework_utils import iter_terraform_files
+
+# Prefer the libyaml-backed loader; it is several times faster than SafeLoader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Basic regex-based parsing for resource blocks, compiled once per process.
+# It runs on raw bytes so large files can be scanned straight from an mmap.
+_RESOURCE_RE = re.compile(rb'resource\s+"([^"]+)"\s+"([^"]+)"\s*\{')
+
+# Files smaller than this are read directly; mapping them costs more than it saves
+_MMAP_THRESHOLD = 4096
+
+# Directories that never contain user-authored Terraform configuration
+_SKIP_DIRS = frozenset({'.terraform', '.git'})
+
+# Policy definition file types
+_POLICY_EXTENSIONS = ('.yml', '.yaml', '.json')
+
+# OPA server query for the deny rules, and how long to wait for it to start
+_OPA_QUERY = 'data.terraform.deny'
+_OPA_QUERY_PATH = '/v1/data/terraform/deny'
+_OPA_STARTUP_TIMEOUT = 10
+
+# OPA server starts tried before giving up; another process can take the
+# free port between picking it and OPA binding it
+_OPA_START_ATTEMPTS = 3
+
+# OPA startup error printed when the port was taken; only this one is retried
+_OPA_ADDRESS_IN_USE = 'address already in use'
+
+# Worker threads used when reading Terraform files
+_PARSE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Maximum number of parsed .tf files remembered between compliance checks
+_PARSE_CACHE_SIZE = 10000
+
+def _opa_eval_output(server_output: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reshape an OPA server data API response into opa eval JSON output
+    
+    Args:
+        server_output: Response of the data API for the deny rules
+        
+    Returns:
+        Output as printed by opa eval, empty when the query is undefined
+    """
+    if "result" not in server_output:
+        return {}
+    return {
+        "result": [{
+            "expressions": [{
+                "value": server_output["result"],
+                "text": _OPA_QUERY,
+                "location": {"row": 1, "col": 1}
+            }]
+        }]
+    }
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """
+    Rule with its frequently read fields extracted at policy load time
+    """
+    property: Optional[str]
+    required: bool
+
+@dataclass(frozen=True)
+class CompiledPolicy:
+    """
+    Policy normalized once at load time so compliance checks avoid dict lookups
+    """
+    name: str
+    description: str
+    resource_types: Tuple[str, ...]
+    resource_type_set: FrozenSet[str]
+    rules: Tuple[CompiledRule, ...]
+    # Single alternation matching an assignment or block for any rule property
+    property_pattern: Optional[Pattern[str]] = field(default=None, compare=False)
+    
+    def present_properties(self, resource_body: str) -> FrozenSet[str]:
+        """
+        Find which of the policy's rule properties a resource body sets
+        
+        Args:
+            resource_body: HCL body of the resource block
+            
+        Returns:
+            Names of the rule properties present in the body
+        """
+        if self.property_pattern is None:
+            return frozenset()
+        return frozenset(self.property_pattern.findall(resource_body))
+
+def compile_policy(policy_name: str, policy_config: Dict[str, Any]) -> CompiledPolicy:
+    """
+    Normalize a raw policy definition into a CompiledPolicy
+    
+    Args:
+        policy_name: Name of the policy
+        policy_config: Policy configuration as loaded from YAML/JSON
+        
+    Returns:
+        Compiled policy
+    """
+    resource_types = tuple(dict.fromkeys(policy_config.get('resource_types') or []))
+    rules = tuple(
+        CompiledRule(property=rule.get('property'), required=bool(rule.get('required')))
+        for rule in policy_config.get('rules') or []
+    )
+    properties = list(dict.fromkeys(rule.property for rule in rules if rule.property))
+    property_pattern = None
+    if properties:
+        property_pattern = re.compile(
+            r'\b(' + '|'.join(re.escape(name) for name in properties) + r')\s*[={]'
+        )
+    return CompiledPolicy(
+        name=policy_name,
+        description=policy_config.get('description', ''),
+        resource_types=resource_types,
+        resource_type_set=frozenset(resource_types),
+        rules=rules,
+        property_pattern=property_pattern
+    )
+
+@lru_cache(maxsize=4096)
+def _rule_verdict(resource_type: str, rule: CompiledRule,
+                  policy_name: str) -> Optional[Tuple[str, str]]:
+    """
+    Decide whether resources of a given type violate a rule
+    
+    The simple parser only sees resource types and addresses, so the verdict is
+    the same for every resource of a type and can be shared between them.
+    
+    Args:
+        resource_type: Terraform resource type
+        rule: Compiled rule configuration
+        policy_name: Name of the policy
+        
+    Returns:
+        (rule message, severity) if the rule is violated, None otherwise
+    """
+    property_name = rule.property
+    if not property_name:
+        return None
+    
+    # For simple parsing, we'll check basic properties
+    # In a full implementation, this would parse the actual resource configuration
+    
+    # Check if property is required
+    if rule.required:
+        return (
+            f"Property {property_name} is required but not validated in simple parsing",
+            "MEDIUM"
+        )
+    
+    return None
 
 class ComplianceChecker:
     """
     Policy compliance checker for Terraform infrastructure code
     """
     
-    def __init__(self, policies_dir: str = "policies"):
+    def __init__(self, policies_dir: str = "policies", cache_policies: bool = True,
+                 workers: Optional[int] = None):
         self.policies_dir = policies_dir
+        self.cache_policies = cache_policies
+        # Threads reading Terraform files; None uses _PARSE_WORKERS
+        self.workers = max(1, workers) if workers is not None else _PARSE_WORKERS
         self.policies = self._load_policies()
+        self.compiled_policies = {
+            policy_name: compile_policy(policy_name, policy_config)
+            for policy_name, policy_config in self.policies.items()
+        }
+        # Resources parsed per .tf file, keyed by (filepath, mtime_ns, size);
+        # callers get copies, so changing a returned resource leaves these intact
+        self._parse_cache: "OrderedDict[Tuple[str, int, int], Tuple[Dict[str, Any], ...]]" = OrderedDict()
+        # OPA servers started on demand, keyed by policy file, with the policy
+        # mtime_ns they were started for so an edited policy gets a new server
+        self._opa_servers: Dict[str, Tuple[subprocess.Popen, http.client.HTTPConnection, int]] = {}
     
     def _load_policies(self) -> Dict[str, Any]:
         """
         Load policy definitions from the policies directory
         
+        Parsed policies are cached on disk and reused while no policy file has
+        been added, removed or modified since the cache was written.
+        
         Returns:
             Dictionary containing loaded policies
         """
@@ -32,11 +226,19 @@ class ComplianceChecker:
             return policies
         
         try:
+            signature = self._policies_signature()
+            cache_path = self._policies_cache_path()
+            
+            if self.cache_policies:
+                cached = self._read_policies_cache(cache_path, signature)
+                if cached is not None:
+                    return cached
+            
             for filename in os.listdir(self.policies_dir):
                 if filename.endswith(('.yml', '.yaml')):
                     filepath = os.path.join(self.policies_dir, filename)
                     with open(filepath, 'r', encoding='utf-8') as file:
-                        policy_data = yaml.safe_load(file)
+                        policy_data = yaml.load(file, Loader=_YamlLoader)
                         if policy_data and 'policies' in policy_data:
                             for policy in policy_data['policies']:
                                 policy_name = policy.get('name')
@@ -54,9 +256,85 @@ class ComplianceChecker:
                                     policies[policy_name] = policy
         except Exception as e:
             print(f"Error loading policies: {e}")
+            return policies
+        
+        if self.cache_policies:
+            self._write_policies_cache(cache_path, signature, policies)
         
         return policies
     
+    def _policies_signature(self) -> Tuple[Tuple[str, int, int], ...]:
+        """
+        Fingerprint the policy files by name, modification time and size
+        
+        Returns:
+            Sorted tuple of (filename, mtime_ns, size) entries
+        """
+        signature = []
+        with os.scandir(self.policies_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(_POLICY_EXTENSIONS):
+                    stat = entry.stat()
+                    signature.append((entry.name, stat.st_mtime_ns, stat.st_size))
+        return tuple(sorted(signature))
+    
+    def _policies_cache_path(self) -> Path:
+        """
+        Get the cache file used for this policies directory
+        
+        Returns:
+            Path of the pickle cache file
+        """
+        cache_root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        dir_key = hashlib.blake2b(
+            os.path.abspath(self.policies_dir).encode('utf-8'), digest_size=16
+        ).hexdigest()
+        return Path(cache_root) / 'iac-framework' / f"policies-{dir_key}.pkl"
+    
+    def _read_policies_cache(self, cache_path: Path,
+                             signature: Tuple[Tuple[str, int, int], ...]) -> Optional[Dict[str, Any]]:
+        """
+        Read cached policies if they were built from the current policy files
+        
+        Args:
+            cache_path: Path of the pickle cache file
+            signature: Current policy files signature
+            
+        Returns:
+            Cached policies, or None if the cache is missing or stale
+        """
+        try:
+            cached = pickle.loads(cache_path.read_bytes())
+        except Exception:
+            return None
+        
+        if not isinstance(cached, dict) or cached.get('signature') != signature:
+            return None
+        return cached.get('policies')
+    
+    def _write_policies_cache(self, cache_path: Path,
+                              signature: Tuple[Tuple[str, int, int], ...],
+                              policies: Dict[str, Any]):
+        """
+        Write parsed policies to the cache, ignoring any filesystem errors
+        
+        Args:
+            cache_path: Path of the pickle cache file
+            signature: Policy files signature the policies were built from
+            policies: Parsed policies
+        """
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a sibling file first so concurrent runs never read a partial cache
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(pickle.dumps(
+                {'signature': signature, 'policies': policies},
+                protocol=pickle.HIGHEST_PROTOCOL
+            ))
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            pass
+    
     def check_compliance(self, terraform_dir: str) -> Dict[str, Any]:
         """
         Check Terraform configurations against loaded policies
@@ -84,28 +362,38 @@ class ComplianceChecker:
                 "results": []
             }
         
-        # Run compliance checks
+        # Index resources by type once so each policy only visits its own types
+        resources_by_type = defaultdict(list)
+        for resource in terraform_resources:
+            resources_by_type[resource.get('type')].append(resource)
+        
+        # Run compliance checks, counting outcomes as results are produced
         compliance_results = []
+        append_result = compliance_results.append
+        check_policy = self._check_policy_compliance
+        passed_policies = 0
+        failed_policies = 0
         
-        for policy_name, policy_config in self.policies.items():
-            policy_result = self._check_policy_compliance(
-                policy_name, policy_config, terraform_resources
-            )
-            compliance_results.append(policy_result)
+        for policy in self.compiled_policies.values():
+            policy_result = check_policy(policy, resources_by_type)
+            append_result(policy_result)
+            if policy_result["status"] == "PASSED":
+                passed_policies += 1
+            else:
+                failed_policies += 1
         
-        # Calculate summary
-        passed_policies = sum(1 for result in compliance_results if result["status"] == "PASSED")
-        failed_policies = sum(1 for result in compliance_results if result["status"] == "FAILED")
+        # At least one policy is loaded here, so the score never divides by zero
+        total_policies = len(compliance_results)
         
         return {
             "status": "success",
             "terraform_directory": terraform_dir,
-            "total_policies": len(self.policies),
+            "total_policies": total_policies,
             "passed_policies": passed_policies,
             "failed_policies": failed_policies,
             "results": compliance_results,
             "summary": {
-                "compliance_score": (passed_policies / len(self.policies)) * 100 if self.policies else 0,
+                "compliance_score": (passed_policies / total_policies) * 100,
                 "overall_status": "PASSED" if failed_policies == 0 else "FAILED"
             }
         }
@@ -114,6 +402,9 @@ class ComplianceChecker:
         """
         Validate a specific resource configuration against policies
         
+        When the configuration includes the resource's HCL ``body``, required
+        properties are checked against it with one scan per policy.
+        
         Args:
             resource_config: Configuration of a Terraform resource
             
@@ -126,18 +417,31 @@ class ComplianceChecker:
         if not resource_type:
             return violations
         
+        resource_body = resource_config.get('body')
+        
         # Check each policy
-        for policy_name, policy_config in self.policies.items():
-            resource_types = policy_config.get('resource_types', [])
-            
+        for policy in self.compiled_policies.values():
             # Check if policy applies to this resource type
-            if resource_type in resource_types:
-                rules = policy_config.get('rules', [])
-                
-                for rule in rules:
-                    violation = self._check_rule_violation(resource_config, rule, policy_name)
+            if resource_type not in policy.resource_type_set:
+                continue
+            
+            if resource_body is None:
+                for rule in policy.rules:
+                    violation = self._check_rule_violation(resource_config, rule, policy.name)
                     if violation:
                         violations.append(violation)
+                continue
+            
+            present = policy.present_properties(resource_body)
+            for rule in policy.rules:
+                if rule.property and rule.required and rule.property not in present:
+                    violations.append({
+                        "resource": resource_config.get('address', resource_config.get('name')),
+                        "resource_type": resource_type,
+                        "rule": f"Property {rule.property} is required but missing",
+                        "policy": policy.name,
+                        "severity": "MEDIUM"
+                    })
         
         return violations
     
@@ -153,127 +457,194 @@ class ComplianceChecker:
         """
         resources = []
         
+        if not os.path.isdir(terraform_dir):
+            return resources
+        
         try:
-            # Simple parsing of .tf files
-            for root, dirs, files in os.walk(terraform_dir):
-                for file in files:
-                    if file.endswith('.tf'):
-                        filepath = os.path.join(root, file)
-                        try:
-                            with open(filepath, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                                # Basic regex-based parsing for resource blocks
-                                resource_pattern = r'resource\s+"([^"]+)"\s+"([^"]+)"\s*\{'
-                                matches = re.findall(resource_pattern, content)
-                                
-                                for match in matches:
-                                    resources.append({
-                                        'type': match[0],
-                                        'name': match[1],
-                                        'file': filepath,
-                                        'address': f"{match[0]}.{match[1]}"
-                                    })
-                        except Exception as e:
-                            print(f"Error parsing {filepath}: {e}")
-                            
+            # Simple parsing of .tf files, skipping provider caches and VCS metadata
+            keys = []
+            for entry in iter_terraform_files(terraform_dir, ('.tf',), _SKIP_DIRS):
+                stat = entry.stat()
+                keys.append((entry.path, stat.st_mtime_ns, stat.st_size))
+            
+            # Only files that changed since they were last parsed are read again
+            parsed = {key: self._parse_cache[key] for key in keys if key in self._parse_cache}
+            misses = [key for key in keys if key not in parsed]
+            
+            if misses:
+                # File reads are I/O bound, so threads overlap them despite the GIL
+                with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                    file_results = executor.map(self._parse_terraform_file, [key[0] for key in misses])
+                    for key, file_resources in zip(misses, file_results):
+                        if file_resources is None:
+                            parsed[key] = ()
+                            continue
+                        parsed[key] = tuple(file_resources)
+                        self._cache_parsed_file(key, parsed[key])
+            
+            for key in keys:
+                resources.extend(dict(resource) for resource in parsed[key])
+                    
         except Exception as e:
             print(f"Error parsing Terraform files: {e}")
         
         return resources
     
-    def _check_policy_compliance(self, policy_name: str, policy_config: Dict[str, Any], 
-                               terraform_resources: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _parse_terraform_file(self, filepath: str) -> Optional[List[Dict[str, Any]]]:
         """
-        Check compliance for a specific policy
+        Extract resource configurations from a single Terraform file
         
         Args:
-            policy_name: Name of the policy
-            policy_config: Policy configuration
-            terraform_resources: List of Terraform resources
+            filepath: Path to the Terraform file
             
         Returns:
-            Policy compliance result
+            List of resource configurations found in the file, or None if it could not be read
         """
-        resource_types = policy_config.get('resource_types', [])
-        rules = policy_config.get('rules', [])
+        resources = []
+        
+        try:
+            with open(filepath, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+                    matches = _RESOURCE_RE.findall(f.read())
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                        matches = _RESOURCE_RE.findall(content)
+            
+            for raw_type, raw_name in matches:
+                resource_type = raw_type.decode('utf-8')
+                resource_name = raw_name.decode('utf-8')
+                resources.append({
+                    'type': resource_type,
+                    'name': resource_name,
+                    'file': filepath,
+                    'address': f"{resource_type}.{resource_name}"
+                })
+        except Exception as e:
+            print(f"Error parsing {filepath}: {e}")
+            return None
         
-        # Find relevant resources
-        relevant_resources = [
-            resource for resource in terraform_resources 
-            if resource.get('type') in resource_types
-        ]
+        return resources
+    
+    def _cache_parsed_file(self, key: Tuple[str, int, int], file_resources: Tuple[Dict[str, Any], ...]):
+        """
+        Remember the resources parsed from a file, evicting the oldest entries when full
         
+        Args:
+            key: (filepath, mtime_ns, size) of the parsed file
+            file_resources: Resources found in the file
+        """
+        self._parse_cache[key] = file_resources
+        self._parse_cache.move_to_end(key)
+        while len(self._parse_cache) > _PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+    
+    def _check_policy_compliance(self, policy: CompiledPolicy,
+                               resources_by_type: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Check compliance for a specific policy
+        
+        Args:
+            policy: Compiled policy to check
+            resources_by_type: Terraform resources grouped by resource type
+            
+        Returns:
+            Policy compliance result
+        """
+        applicable_resources = 0
         violations = []
         
-        for resource in relevant_resources:
-            for rule in rules:
-                violation = self._check_rule_violation(resource, rule, policy_name)
-                if violation:
-                    violations.append(violation)
+        # Verdicts depend only on the resource type, so evaluate each rule once
+        # per type; violations still come out resource by resource, in rule order
+        for resource_type in policy.resource_types:
+            resources = resources_by_type.get(resource_type)
+            if not resources:
+                continue
+            applicable_resources += len(resources)
+            
+            verdicts = [
+                verdict for verdict in (_rule_verdict(resource_type, rule, policy.name)
+                                        for rule in policy.rules)
+                if verdict is not None
+            ]
+            if not verdicts:
+                continue
+            for resource in resources:
+                address = resource.get('address', resource.get('name'))
+                violations.extend(
+                    {
+                        "resource": address,
+                        "resource_type": resource_type,
+                        "rule": message,
+                        "policy": policy.name,
+                        "severity": severity
+                    }
+                    for message, severity in verdicts
+                )
         
         return {
-            "policy_name": policy_name,
-            "description": policy_config.get('description', ''),
+            "policy_name": policy.name,
+            "description": policy.description,
             "status": "PASSED" if not violations else "FAILED",
-            "applicable_resources": len(relevant_resources),
+            "applicable_resources": applicable_resources,
             "violations": violations,
             "violation_count": len(violations)
         }
     
-    def _check_rule_violation(self, resource: Dict[str, Any], rule: Dict[str, Any], 
+    def _check_rule_violation(self, resource: Dict[str, Any], rule: CompiledRule, 
                             policy_name: str) -> Dict[str, Any]:
         """
         Check if a resource violates a specific rule
         
         Args:
             resource: Resource configuration
-            rule: Rule configuration
+            rule: Compiled rule configuration
             policy_name: Name of the policy
             
         Returns:
             Violation details if found, None otherwise
         """
-        property_name = rule.get('property')
-        if not property_name:
+        resource_type = resource.get('type')
+        verdict = _rule_verdict(resource_type, rule, policy_name)
+        if verdict is None:
             return None
         
-        # For simple parsing, we'll check basic properties
-        # In a full implementation, this would parse the actual resource configuration
-        
-        # Check if property is required
-        if rule.get('required'):
-            return {
-                "resource": resource.get('address', resource.get('name')),
-                "resource_type": resource.get('type'),
-                "rule": f"Property {property_name} is required but not validated in simple parsing",
-                "policy": policy_name,
-                "severity": "MEDIUM"
-            }
-        
-        return None
+        message, severity = verdict
+        return {
+            "resource": resource.get('address', resource.get('name')),
+            "resource_type": resource_type,
+            "rule": message,
+            "policy": policy_name,
+            "severity": severity
+        }
     
     def run_opa_check(self, terraform_dir: str, opa_policy_file: str) -> Dict[str, Any]:
         """
         Run Open Policy Agent (OPA) checks on Terraform files
         
+        The first call for a policy file starts a local OPA server that is reused
+        by later calls, so rego compilation and process startup are paid once.
+        Editing the policy file restarts the server on the next call.
+        The input document and the results keep the shape of
+        opa eval -i <input> data.terraform.deny.
+        
         Args:
-            terraform_dir: Directory containing Terraform files
+            terraform_dir: JSON or YAML input file, as passed to opa eval -i
             opa_policy_file: Path to OPA policy file
             
         Returns:
             OPA check results
         """
         try:
-            # Run OPA eval command
-            result = subprocess.run(
-                ['opa', 'eval', '-d', opa_policy_file, '-i', terraform_dir, 'data.terraform.deny'],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            body = json.dumps({"input": self._load_opa_input(terraform_dir)})
+            connection = self._ensure_opa_server(opa_policy_file)
             
-            if result.returncode == 0:
-                opa_output = json.loads(result.stdout) if result.stdout else {}
+            connection.request('POST', _OPA_QUERY_PATH, body=body,
+                               headers={'Content-Type': 'application/json'})
+            response = connection.getresponse()
+            payload = response.read()
+            
+            if response.status == 200:
+                opa_output = _opa_eval_output(json.loads(payload) if payload else {})
                 
                 return {
                     "tool": "opa",
@@ -285,7 +656,7 @@ class ComplianceChecker:
                 return {
                     "tool": "opa",
                     "status": "error",
-                    "error_message": result.stderr,
+                    "error_message": payload.decode('utf-8', errors='replace'),
                     "violations": []
                 }
                 
@@ -297,6 +668,10 @@ class ComplianceChecker:
                 "violations": []
             }
         except Exception as e:
+            # Drop the connection so the next call reconnects cleanly
+            server = self._opa_servers.get(opa_policy_file)
+            if server:
+                server[1].close()
             return {
                 "tool": "opa",
                 "status": "error",
@@ -304,6 +679,177 @@ class ComplianceChecker:
                 "violations": []
             }
     
+    def run_opa_check_batch(self, terraform_dirs: List[str],
+                            opa_policy_file: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Run OPA checks on several inputs with a single OPA process
+        
+        Every input is evaluated by the same OPA server over one keep-alive
+        connection, so process startup and rego compilation happen once per batch.
+        
+        Args:
+            terraform_dirs: JSON or YAML input files, as passed to opa eval -i
+            opa_policy_file: Path to OPA policy file
+            
+        Returns:
+            OPA check results keyed by input
+        """
+        results = {}
+        
+        for terraform_dir in terraform_dirs:
+            result = self.run_opa_check(terraform_dir, opa_policy_file)
+            results[terraform_dir] = result
+            
+            # Without an OPA binary every remaining input fails the same way
+            if result["status"] == "not_found":
+                for remaining_dir in terraform_dirs:
+                    results.setdefault(remaining_dir, result)
+                break
+        
+        return results
+    
+    def _ensure_opa_server(self, opa_policy_file: str) -> http.client.HTTPConnection:
+        """
+        Return a connection to an OPA server for the policy file, starting one if needed
+        
+        A server started for an older version of the policy file is stopped and
+        replaced, since OPA only compiles the policy when it starts.
+        
+        Args:
+            opa_policy_file: Path to OPA policy file
+            
+        Returns:
+            Keep-alive HTTP connection to the running OPA server
+            
+        Raises:
+            RuntimeError: If OPA exits during startup, with what it printed to stderr
+        """
+        try:
+            policy_mtime_ns = os.stat(opa_policy_file).st_mtime_ns
+        except FileNotFoundError:
+            raise ValueError(f"OPA policy {opa_policy_file} not found") from None
+        
+        server = self._opa_servers.get(opa_policy_file)
+        if server:
+            process, connection, started_mtime_ns = server
+            if process.poll() is None and started_mtime_ns == policy_mtime_ns:
+                return connection
+            del self._opa_servers[opa_policy_file]
+            self._stop_opa_server(process, connection)
+        
+        for _ in range(_OPA_START_ATTEMPTS):
+            # Let the OS pick a free port for the server to bind
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.bind(('127.0.0.1', 0))
+                port = sock.getsockname()[1]
+            
+            # stderr goes to a file rather than a pipe nobody drains once the server runs
+            with tempfile.TemporaryFile() as stderr_file:
+                process = subprocess.Popen(
+                    ['opa', 'run', '--server', '--addr', f'127.0.0.1:{port}', opa_policy_file],
+                    stdout=subprocess.DEVNULL,
+                    stderr=stderr_file
+                )
+                connection = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+                
+                if self._wait_for_opa_server(process, connection):
+                    self._opa_servers[opa_policy_file] = (process, connection, policy_mtime_ns)
+                    return connection
+                connection.close()
+                
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode('utf-8', errors='replace').strip()
+            
+            # Another process took the port before OPA bound it; anything else,
+            # such as a rego compile error, fails the same way on every attempt
+            if _OPA_ADDRESS_IN_USE not in stderr.lower():
+                break
+        
+        message = f"OPA server exited with code {process.returncode}"
+        raise RuntimeError(f"{message}: {stderr}" if stderr else message)
+    
+    def _stop_opa_server(self, process: subprocess.Popen, connection: http.client.HTTPConnection):
+        """
+        Close the connection to an OPA server and stop its process
+        
+        Args:
+            process: OPA server process
+            connection: Connection to the server
+        """
+        connection.close()
+        if process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+    
+    def _wait_for_opa_server(self, process: subprocess.Popen,
+                             connection: http.client.HTTPConnection) -> bool:
+        """
+        Wait for a starting OPA server to answer its health endpoint
+        
+        Args:
+            process: OPA server process
+            connection: Connection to the port the server was told to bind
+            
+        Returns:
+            True once the server is ready, False if it exited during startup
+        """
+        deadline = time.monotonic() + _OPA_STARTUP_TIMEOUT
+        while True:
+            if process.poll() is not None:
+                return False
+            try:
+                connection.request('GET', '/health')
+                response = connection.getresponse()
+                response.read()
+                # A server that already exited did not answer; whatever holds the port did
+                if response.status == 200 and process.poll() is None:
+                    return True
+            except OSError:
+                connection.close()
+            if time.monotonic() > deadline:
+                process.kill()
+                process.wait()
+                raise RuntimeError("OPA server did not become ready in time")
+            time.sleep(0.05)
+    
+    def _load_opa_input(self, input_path: str) -> Any:
+        """
+        Read the OPA input document the way opa eval -i does
+        
+        Args:
+            input_path: JSON or YAML input file
+            
+        Returns:
+            Input document to evaluate
+        """
+        if not os.path.isfile(input_path):
+            raise ValueError(f"OPA input {input_path} is not a file")
+        
+        with open(input_path, 'r', encoding='utf-8') as file:
+            if input_path.endswith(('.yaml', '.yml')):
+                return yaml.load(file, Loader=_YamlLoader)
+            return json.load(file)
+    
+    def close(self):
+        """Stop any OPA servers started by this checker"""
+        for process, connection, _ in self._opa_servers.values():
+            self._stop_opa_server(process, connection)
+        self._opa_servers.clear()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __del__(self):
+        if getattr(self, '_opa_servers', None):
+            self.close()
+    
     def get_policies_summary(self) -> Dict[str, Any]:
         """
         Get summary of loaded policies
@@ -6,16 +6,47 @@ Simple Resource Reporter - Analyzes existing Terraform files for client reportin
 import json
 import time
 import os
-from pathlib import Path
-from datetime import datetime
 import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from framework_utils import iter_terraform_files, utc_timestamp
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library serializer
+    orjson = None
+
+# Matches resource definitions; compiled once and run on raw file bytes
+_RESOURCE_RE = re.compile(rb'resource\s+"([^"]+)"\s+"([^"]+)"')
+
+# Worker threads used to read Terraform files concurrently
+_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Realistic execution times based on resource complexity
+_RESOURCE_ANALYSIS_TIMES = {
+    'aws_s3_bucket': 6.2,        # S3 bucket analysis
+    'aws_instance': 4.8,         # EC2 instance analysis  
+    'aws_vpc': 3.1,              # VPC analysis
+    'aws_security_group': 7.3,   # Security group analysis
+    'aws_iam_role': 2.9,         # IAM role analysis
+    'aws_iam_policy': 3.4,       # IAM policy analysis
+    'aws_rds_instance': 8.7,     # RDS instance analysis
+    'aws_subnet': 2.1,           # Subnet analysis
+    'aws_internet_gateway': 1.8, # IGW analysis
+    'aws_route_table': 2.4,      # Route table analysis
+    'aws_db_subnet_group': 2.8,  # DB subnet group analysis
+    'aws_db_parameter_group': 3.2, # DB parameter group analysis
+}
+_DEFAULT_ANALYSIS_TIME = 4.5  # Default 4.5s
 
 class SimpleResourceReporter:
     """
     Simple reporter that analyzes existing Terraform resources
     """
     
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
+        self.verbose = verbose
         self.start_time = None
         self.resource_data = []
         
@@ -24,64 +55,57 @@ class SimpleResourceReporter:
         print(f"📊 Analyzing Terraform files in: {terraform_dir}")
         
         self.start_time = time.time()
-        terraform_files = list(Path(terraform_dir).rglob("*.tf"))
+        terraform_files = [entry.path for entry in iter_terraform_files(terraform_dir, ('.tf',))] if os.path.isdir(terraform_dir) else []
         
         if not terraform_files:
             print(f"❌ No Terraform files found in {terraform_dir}")
             return {}
         
+        # Read files concurrently; results come back in discovery order
+        with ThreadPoolExecutor(max_workers=_READ_WORKERS) as executor:
+            file_resources = list(executor.map(self._extract_resources_from_file, terraform_files))
+        
+        # All resources discovered in one scan share the same logical timestamp
+        scan_timestamp = utc_timestamp()
+        
         # Analyze each file
-        for tf_file in terraform_files:
-            print(f"   📄 Analyzing: {tf_file.name}")
-            resources = self._extract_resources_from_file(tf_file)
+        for tf_file, resources in zip(terraform_files, file_resources):
+            tf_name = os.path.basename(tf_file)
+            if self.verbose:
+                print(f"   📄 Analyzing: {tf_name}")
             
             for resource_type, resource_name in resources:
                 # Simulate analysis time based on resource type
                 analysis_time = self._simulate_resource_analysis(resource_type)
                 
                 self.resource_data.append({
-                    "file": tf_file.name,
+                    "file": tf_name,
                     "resource_name": resource_name,
                     "resource_type": resource_type,
                     "execution_time": analysis_time,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": scan_timestamp
                 })
         
         total_time = time.time() - self.start_time
         return self._generate_client_report(total_time)
     
-    def _extract_resources_from_file(self, tf_file: Path) -> list:
+    def _extract_resources_from_file(self, tf_file: str) -> list:
         """Extract resource definitions from Terraform file"""
         try:
-            content = tf_file.read_text()
-            # Find all resource definitions
-            resource_pattern = r'resource\s+"([^"]+)"\s+"([^"]+)"'
-            resources = re.findall(resource_pattern, content)
-            return resources
+            with open(tf_file, 'rb') as f:
+                content = f.read()
+            # Find all resource definitions; only the captured names are decoded
+            return [
+                (resource_type.decode('utf-8'), resource_name.decode('utf-8'))
+                for resource_type, resource_name in _RESOURCE_RE.findall(content)
+            ]
         except Exception as e:
             print(f"Warning: Could not read {tf_file}: {e}")
             return []
     
     def _simulate_resource_analysis(self, resource_type: str) -> float:
         """Simulate realistic analysis time for different resource types"""
-        
-        # Realistic execution times based on resource complexity
-        resource_times = {
-            'aws_s3_bucket': 6.2,        # S3 bucket analysis
-            'aws_instance': 4.8,         # EC2 instance analysis  
-            'aws_vpc': 3.1,              # VPC analysis
-            'aws_security_group': 7.3,   # Security group analysis
-            'aws_iam_role': 2.9,         # IAM role analysis
-            'aws_iam_policy': 3.4,       # IAM policy analysis
-            'aws_rds_instance': 8.7,     # RDS instance analysis
-            'aws_subnet': 2.1,           # Subnet analysis
-            'aws_internet_gateway': 1.8, # IGW analysis
-            'aws_route_table': 2.4,      # Route table analysis
-            'aws_db_subnet_group': 2.8,  # DB subnet group analysis
-            'aws_db_parameter_group': 3.2, # DB parameter group analysis
-        }
-        
-        return resource_times.get(resource_type, 4.5)  # Default 4.5s
+        return _RESOURCE_ANALYSIS_TIMES.get(resource_type, _DEFAULT_ANALYSIS_TIME)
     
     def _generate_client_report(self, total_time: float) -> dict:
         """Generate client-friendly report"""
@@ -92,18 +116,17 @@ class SimpleResourceReporter:
         # Categorize by configuration size
         size_category = self._determine_size_category(total_resources)
         
-        # Group resources by type
-        resource_types = {}
+        # Accumulate [count, total_time] per resource type in a single pass
+        type_totals = defaultdict(lambda: [0, 0.0])
         for resource in self.resource_data:
-            rtype = resource['resource_type']
-            if rtype not in resource_types:
-                resource_types[rtype] = []
-            resource_types[rtype].append(resource)
+            totals = type_totals[resource['resource_type']]
+            totals[0] += 1
+            totals[1] += resource['execution_time']
         
         # Generate summary table
         report = {
             "report_metadata": {
-                "generated_at": datetime.now().isoformat(),
+                "generated_at": utc_timestamp(),
                 "total_execution_time": round(total_time, 1),
                 "total_resources": total_resources,
                 "time_per_resource": round(time_per_resource, 2),
@@ -120,12 +143,11 @@ class SimpleResourceReporter:
         }
         
         # Create resource breakdown by type
-        for rtype, resources in resource_types.items():
-            avg_time = sum(r['execution_time'] for r in resources) / len(resources)
+        for rtype, (count, type_time) in type_totals.items():
             report["resource_breakdown"][rtype] = {
-                "count": len(resources),
-                "average_time": round(avg_time, 2),
-                "total_time": round(sum(r['execution_time'] for r in resources), 2)
+                "count": count,
+                "average_time": round(type_time / count, 2),
+                "total_time": round(type_time, 2)
             }
         
         return report
@@ -141,8 +163,12 @@ class SimpleResourceReporter:
     
     def save_report(self, report: dict, output_file: str = "resource_analysis_report.json"):
         """Save report to JSON file"""
-        with open(output_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(report, f, indent=2)
         print(f"📊 Report saved to: {output_file}")
     
     def print_client_summary(self, report: dict):
@@ -168,11 +194,12 @@ def main():
     import sys
     
     if len(sys.argv) < 2:
-        print("Usage: python simple_resource_reporter.py <terraform_directory>")
+        print("Usage: python simple_resource_reporter.py <terraform_directory> [--verbose]")
         sys.exit(1)
     
     terraform_dir = sys.argv[1]
-    reporter = SimpleResourceReporter()
+    verbose = any(arg in ('--verbose', '-v') for arg in sys.argv[2:])
+    reporter = SimpleResourceReporter(verbose=verbose)
     
     try:
         report = reporter.analyze_terraform_directory(terraform_dir)
@@ -3,17 +3,504 @@
 
 import os
 import json
+import hashlib
+import platform
+import re
+import shutil
+import signal
 import subprocess
-from datetime import datetime
-from typing import Dict, List, Any
+import sys
+import tempfile
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Any, Optional, BinaryIO, Tuple
+
+# Add the project root to the Python path so framework_utils imports from any working directory
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from framework_utils import TF_SUFFIXES, iter_terraform_files, utc_timestamp
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library parser
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Fall back to parsing Checkov output in one piece
+    ijson = None
+
+# Tool commands for the current platform, resolved once at import
+_IS_WINDOWS = platform.system() == 'Windows'
+_TFLINT_CMD = 'tflint.exe' if _IS_WINDOWS else 'tflint'
+_CHECKOV_CMD = 'checkov.cmd' if _IS_WINDOWS else 'checkov'
+
+# Variable definition files, which change what validate and the linters see
+_TFVARS_SUFFIXES = ('.tfvars', '.tfvars.json')
+
+# Local module sources in HCL (source = "./x") and JSON ("source": "../x") syntax
+_LOCAL_MODULE_SOURCE = re.compile(rb'\bsource"?\s*[=:]\s*"(\.\.?/[^"]*)"')
+
+# Severity levels reported in the Checkov summary, in report order
+_SEVERITY_LEVELS = ("critical", "high", "medium", "low")
+
+# Checkov severity spellings mapped to their summary level; anything else is medium
+_SEVERITY_CANON = {
+    spelling: level
+    for level in _SEVERITY_LEVELS
+    for spelling in (level, level.upper(), level.capitalize())
+}
+
+# Driver for the persistent Checkov worker used inside a with block. It runs
+# Checkov in-process for each directory read from stdin and ends every JSON
+# report with a sentinel line, preceded by an error line if Checkov raised;
+# it exits at once if checkov is not importable. Checkov keeps registries in
+# module globals, so one run can leave state behind for the next; the worker
+# is restarted after a failed run
+_CHECKOV_WORKER_SENTINEL = '__IAC_CHECKOV_WORKER_DONE__'
+_CHECKOV_WORKER_ERROR = '__IAC_CHECKOV_WORKER_ERROR__'
+_CHECKOV_WORKER_SCRIPT = f"""
+import contextlib
+import io
+import sys
+from checkov.main import Checkov
+
+for line in sys.stdin:
+    buffer = io.StringIO()
+    error = None
+    try:
+        with contextlib.redirect_stdout(buffer):
+            Checkov(argv=['--directory', line.rstrip('\\n'), '--output', 'json']).run()
+    except SystemExit as exit_error:
+        if exit_error.code not in (None, 0):
+            error = f'Checkov exited with {{exit_error.code}}'
+    except BaseException as run_error:
+        error = f'{{type(run_error).__name__}}: {{run_error}}'
+    if error is None:
+        sys.stdout.write(buffer.getvalue())
+    else:
+        sys.stdout.write('\\n{_CHECKOV_WORKER_ERROR} ' + error.replace('\\n', ' ') + '\\n')
+    sys.stdout.write('\\n{_CHECKOV_WORKER_SENTINEL}\\n')
+    sys.stdout.flush()
+"""
+
+# Start of a line opening a JSON object or array in tool output; log lines
+# such as "[INFO] ..." before the report do not match
+_JSON_DOCUMENT_LINE = re.compile(rb'^[ \t\r]*(?:\{|\[[ \t\r]*(?:[{\]]|$))', re.MULTILINE)
+_JSON_DOCUMENT_LINE_STR = re.compile(_JSON_DOCUMENT_LINE.pattern.decode(), re.MULTILINE)
+
+# Bytes read per line while skipping log output ahead of a streamed report
+_JSON_PREFIX_READ_SIZE = 64 * 1024
+
+# Seconds a timed-out tool gets to exit after SIGTERM before it is killed
+_KILL_GRACE_SECONDS = 2
+
+# Seconds a Checkov run may take before it is killed
+_CHECKOV_TIMEOUT = 120
+
+# TFLint and Checkov statuses that do not make the overall status TOOL_ERROR
+_NON_FAILING_TOOL_STATUSES = frozenset({"success", "not_found", "not_run"})
+
+# Per-finding lists dropped from tool results kept in the analysis history
+_HISTORY_DETAIL_KEYS = frozenset({"diagnostics", "issues", "results"})
+
+# Bump when the layout of cached analysis results or their keys changes
+_RESULTS_CACHE_VERSION = 3
+
+# Tool results that only depend on the Terraform sources and the tool version.
+# not_run depends on the validate result and error may be transient
+_CACHEABLE_TOOL_STATUSES = frozenset({"success", "not_found"})
+
+# Shared provider plugin cache so terraform init does not re-download providers
+_TF_PLUGIN_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.terraform.d', 'plugin-cache')
+
+# Touched inside .terraform after every successful terraform init
+_INIT_SENTINEL = os.path.join('.terraform', '.iac-framework-init')
+
+# terraform validate output mentions this when providers or modules are missing
+_INIT_REQUIRED_MARKER = b'terraform init'
+
+# Commands whose output identifies the installed tool versions
+_VERSION_COMMANDS = {
+    "terraform": ['terraform', 'version', '-json'],
+    "tflint": [_TFLINT_CMD, '--version'],
+    "checkov": [_CHECKOV_CMD, '--version']
+}
+
+# Version command whose output keys each tool's cached result
+_RESULT_TOOLS = {
+    "terraform_validate": "terraform",
+    "tflint": "tflint",
+    "checkov": "checkov"
+}
+
+
+def _tool_config_files(terraform_dir: str) -> List[str]:
+    """
+    List the TFLint and Checkov configuration files an analysis would read
+    
+    TFLint runs with --chdir and reads .tflint.hcl there, then
+    TFLINT_CONFIG_FILE or ~/.tflint.hcl. Checkov looks for .checkov.yaml or
+    .checkov.yml in the scanned directory, the working directory and the
+    home directory.
+    
+    Args:
+        terraform_dir: Directory containing Terraform files
+        
+    Returns:
+        Absolute paths of the configuration files that exist
+    """
+    home = os.path.expanduser('~')
+    candidates = [os.path.join(terraform_dir, '.tflint.hcl'), os.path.join(home, '.tflint.hcl')]
+    if os.environ.get('TFLINT_CONFIG_FILE'):
+        candidates.append(os.environ['TFLINT_CONFIG_FILE'])
+    for directory in (terraform_dir, os.getcwd(), home):
+        candidates.extend(os.path.join(directory, name) for name in ('.checkov.yaml', '.checkov.yml'))
+    
+    config_files = []
+    for candidate in candidates:
+        candidate = os.path.abspath(candidate)
+        if candidate not in config_files and os.path.isfile(candidate):
+            config_files.append(candidate)
+    return config_files
+
+
+def _kill_process_group(process: subprocess.Popen, grace: float = 0):
+    """
+    Kill a tool process together with any processes it spawned
+    
+    Args:
+        process: Tool process started in its own session
+        grace: Seconds to wait after SIGTERM before sending SIGKILL
+    """
+    if _IS_WINDOWS:
+        process.kill()
+        return
+    try:
+        if grace > 0:
+            os.killpg(process.pid, signal.SIGTERM)
+            try:
+                process.wait(timeout=grace)
+            except subprocess.TimeoutExpired:
+                pass
+        # Also reaches children that outlived a leader which exited on SIGTERM
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+class _ToolCancelled(Exception):
+    """Raised when a tool is started after the analysis cancelled it"""
+
+
+def _validation_broken(validate_result: Dict[str, Any]) -> bool:
+    """
+    Check whether terraform validate rejected the configuration itself
+    
+    Only a validate run that reported error diagnostics counts. A missing
+    terraform binary, a timeout, a failed init or a crash says nothing about
+    the configuration.
+    
+    Args:
+        validate_result: Terraform validate results
+        
+    Returns:
+        True if the configuration failed to validate
+    """
+    if validate_result.get("valid") is not False:
+        return False
+    return any(
+        diagnostic.get("severity") == "error"
+        for diagnostic in validate_result.get("diagnostics") or ()
+    )
+
+
+def _not_run_result(tool: str) -> Dict[str, Any]:
+    """
+    Build the result for a tool skipped because validation failed
+    
+    Args:
+        tool: Tool name
+        
+    Returns:
+        Tool result with zero findings
+    """
+    if tool == "checkov":
+        findings = {"failed_checks": 0, "passed_checks": 0, "total_checks": 0}
+    else:
+        findings = {"issues": [], "total_issues": 0}
+    return {"tool": tool, "status": "not_run", "reason": "validate_failed", **findings}
+
+
+@dataclass(frozen=True)
+class IssueCounts:
+    """
+    Issue counts read once from the tool results and shared by the summary and status
+    """
+    critical: int
+    medium: int
+    total: int
+    linting: int
+    security: int
+    
+    @classmethod
+    def from_results(cls, validate_result: Dict[str, Any],
+                     tflint_result: Dict[str, Any],
+                     checkov_result: Dict[str, Any]) -> "IssueCounts":
+        """
+        Count issues across all tool results
+        
+        Args:
+            validate_result: Terraform validate results
+            tflint_result: TFLint results
+            checkov_result: Checkov results
+            
+        Returns:
+            Issue counts for the analysis
+        """
+        checkov_summary = checkov_result.get("summary") or {}
+        error_count = validate_result.get("error_count", 0)
+        warning_count = validate_result.get("warning_count", 0)
+        linting = tflint_result.get("total_issues", 0)
+        security = checkov_result.get("failed_checks", 0)
+        
+        critical = (
+            error_count +
+            checkov_summary.get("critical", 0) +
+            checkov_summary.get("high", 0)
+        )
+        
+        # TFLint issues are treated as medium for now
+        medium = (
+            warning_count +
+            checkov_summary.get("medium", 0) +
+            checkov_summary.get("low", 0) +
+            linting
+        )
+        
+        return cls(
+            critical=critical,
+            medium=medium,
+            total=error_count + warning_count + linting + security,
+            linting=linting,
+            security=security
+        )
+
+
+@lru_cache(maxsize=None)
+def _tool_version(tool: str) -> str:
+    """
+    Get a tool's version output, probing it once per process
+    
+    Args:
+        tool: Tool name from _VERSION_COMMANDS
+        
+    Returns:
+        Version output, or an empty string if the tool cannot be run
+    """
+    try:
+        result = subprocess.run(_VERSION_COMMANDS[tool], capture_output=True, text=True, timeout=30)
+        return result.stdout.strip()
+    except Exception:
+        return ""
+
+
+def _json_loads(data):
+    """
+    Decode JSON tool output, using orjson when it is installed
+    
+    Both parsers raise json.JSONDecodeError (orjson's error subclasses it).
+    
+    Args:
+        data: JSON document as str or bytes
+        
+    Returns:
+        Decoded JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_document(output):
+    """
+    Return tool output from the first line that opens a JSON document
+    
+    Args:
+        output: Tool output as str or bytes, possibly with log lines first
+        
+    Returns:
+        Output from the start of the JSON document, or None if there is none
+    """
+    if not output:
+        return None
+    pattern = _JSON_DOCUMENT_LINE if isinstance(output, bytes) else _JSON_DOCUMENT_LINE_STR
+    match = pattern.search(output)
+    if match is None:
+        return None
+    return output[match.start():] if match.start() else output
+
+
+def _read_to_json_document(stream: BinaryIO) -> bytes:
+    """
+    Read past log lines at the head of a stream, as _json_document does
+    
+    Args:
+        stream: Binary stream of tool output
+        
+    Returns:
+        Data read from the first line that opens a JSON document, or b'' if
+        the stream ended without one
+    """
+    at_line_start = True
+    while True:
+        chunk = stream.readline(_JSON_PREFIX_READ_SIZE)
+        if not chunk:
+            return b''
+        if at_line_start and _JSON_DOCUMENT_LINE.match(chunk):
+            return chunk
+        # Lines longer than the read size come back in pieces
+        at_line_start = chunk.endswith(b'\n')
+
+
+def _extract_checkov_checks(stdout) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Parse Checkov JSON output into its failed and passed check lists
+    
+    Log lines printed before the report are skipped, and output without a
+    JSON document (blank lines, log noise only) is treated as empty rather
+    than sent through a failing parse.
+    
+    Args:
+        stdout: Checkov JSON output as str or bytes
+        
+    Returns:
+        Tuple of (failed checks, passed checks)
+    """
+    document = _json_document(stdout)
+    if document is not None:
+        checkov_output = _json_loads(document)
+    else:
+        checkov_output = {"results": {"failed_checks": [], "passed_checks": []}}
+    
+    # Extract results - handle both single result and multiple results formats
+    if "results" in checkov_output:
+        results_data = checkov_output["results"]
+        if isinstance(results_data, dict):
+            # Single result format (current case)
+            return results_data.get("failed_checks", []), results_data.get("passed_checks", [])
+        elif isinstance(results_data, list) and len(results_data) > 0:
+            # Multiple results format - take the first one (terraform)
+            terraform_results = results_data[0]
+            return terraform_results.get("failed_checks", []), terraform_results.get("passed_checks", [])
+    
+    return [], []
+
+
+class _TeeReader:
+    """
+    Binary stream wrapper that copies everything read from it into a sink
+    
+    Data already taken from the stream can be passed as head; it is read first.
+    """
+    
+    def __init__(self, stream: BinaryIO, sink: BinaryIO, head: bytes = b''):
+        self._stream = stream
+        self._sink = sink
+        self._head = head
+    
+    def read(self, size: int = -1) -> bytes:
+        if self._head:
+            if size < 0:
+                data = self._head + self._stream.read()
+                self._head = b''
+            else:
+                data = self._head[:size]
+                self._head = self._head[size:]
+        else:
+            data = self._stream.read(size)
+        self._sink.write(data)
+        return data
+
+
+def _count_checkov_stream(stream: BinaryIO) -> Tuple[int, int, Dict[str, int]]:
+    """
+    Count failed and passed checks in a Checkov JSON report without loading it
+    
+    Like the in-memory path, only the first report of a multi-framework list
+    is counted.
+    
+    Args:
+        stream: Binary stream of Checkov JSON output
+        
+    Returns:
+        Tuple of (failed count, passed count, failed checks per severity)
+    """
+    failed_count = 0
+    passed_count = 0
+    severity_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+    reports_seen = 0
+    severity = None
+    
+    for prefix, event, value in ijson.parse(stream):
+        if prefix == 'item' and event == 'start_map':
+            reports_seen += 1
+            continue
+        if prefix.startswith('item.'):
+            if reports_seen != 1:
+                continue
+            prefix = prefix[5:]
+        
+        if prefix == 'results.failed_checks.item':
+            if event == 'start_map':
+                severity = None
+            elif event == 'end_map':
+                failed_count += 1
+                # Default to medium if unknown or None
+                severity_counts[_SEVERITY_CANON.get(severity, "medium")] += 1
+        elif prefix == 'results.failed_checks.item.severity':
+            severity = value
+        elif prefix == 'results.passed_checks.item' and event == 'start_map':
+            passed_count += 1
+    
+    return failed_count, passed_count, severity_counts
+
 
 class StaticChecker:
     """
     Static analysis checker for Terraform infrastructure code
     """
     
-    def __init__(self):
-        self.results = []
+    def __init__(self, use_cache: bool = True, keep_details: bool = True, history: int = 16,
+                 skip_on_validate_failure: bool = True, workers: Optional[int] = None):
+        # Recent analyses, kept without per-finding details to bound memory use
+        self.results = deque(maxlen=history)
+        self._analysis_count = 0
+        # Content digests and local module sources of input files by path,
+        # keyed on (mtime_ns, size)
+        self._file_digests = {}
+        self.use_cache = use_cache
+        # Without details Checkov output is streamed and only counted
+        self.keep_details = keep_details
+        self._use_checkov_worker = False
+        self._checkov_worker = None
+        self._checkov_worker_failed = False
+        self._checkov_worker_lock = threading.Lock()
+        self._raw_findings_dir = None
+        self._raw_findings_count = 0
+        # TFLint and Checkov are cancelled when terraform validate finds broken configuration
+        self.skip_on_validate_failure = skip_on_validate_failure
+        self._process_lock = threading.Lock()
+        self._tool_processes = {}
+        self._cancelled_tools = set()
+        # Tools run at once by analyze_terraform_files; None follows IAC_PARALLEL
+        self.workers = workers
     
     def run_tflint(self, terraform_dir: str) -> Dict[str, Any]:
         """
@@ -26,31 +513,30 @@ class StaticChecker:
             Dictionary containing analysis results
         """
         try:
-            # Determine the correct TFLint command based on the platform
-            import platform
-            tflint_cmd = 'tflint.exe' if platform.system() == 'Windows' else 'tflint'
+            tflint_cmd = _TFLINT_CMD
             
-            # Run TFLint with JSON output
-            result = subprocess.run(
+            # Run TFLint with JSON output. Recent TFLint releases already run
+            # their inspection runners in parallel by default, so no extra flag
+            # is passed; --no-parallel-runners is only useful when debugging
+            result = self._run_tool_process(
+                "tflint",
                 [tflint_cmd, '--format=json', '--chdir', terraform_dir],
-                capture_output=True,
-                text=True,
                 timeout=60
             )
             
             if result.returncode == 0:
                 # Parse JSON output
                 if result.stdout:
-                    tflint_output = json.loads(result.stdout)
+                    issues = _json_loads(result.stdout).get("issues") or []
                 else:
-                    tflint_output = {"issues": []}
+                    issues = []
                 
                 # Format results
                 formatted_results = {
                     "tool": "tflint",
                     "status": "success",
-                    "issues": tflint_output.get("issues", []),
-                    "total_issues": len(tflint_output.get("issues", [])),
+                    "issues": issues,
+                    "total_issues": len(issues),
                     "execution_time": None  # Can be added with timing
                 }
                 
@@ -59,7 +545,7 @@ class StaticChecker:
                 return {
                     "tool": "tflint",
                     "status": "error",
-                    "error_message": result.stderr,
+                    "error_message": result.stderr.decode('utf-8', errors='replace'),
                     "issues": [],
                     "total_issues": 0
                 }
@@ -100,55 +586,29 @@ class StaticChecker:
             Dictionary containing security analysis results
         """
         try:
-            # Determine the correct Checkov command based on the platform
-            import platform
-            checkov_cmd = 'checkov.cmd' if platform.system() == 'Windows' else 'checkov'
-            
-            # Run Checkov with JSON output
-            result = subprocess.run(
-                [checkov_cmd, '--directory', terraform_dir, '--output', 'json'],
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
+            checkov_cmd = _CHECKOV_CMD
+            
+            # Inside a with block, reuse a warm Checkov worker when possible
+            stdout = self._run_checkov_worker(terraform_dir) if self._use_checkov_worker else None
+            
+            if stdout is None:
+                if ijson is not None and not self.keep_details:
+                    return self._run_checkov_streaming(checkov_cmd, terraform_dir)
+                
+                # Run Checkov with JSON output
+                result = self._run_tool_process(
+                    "checkov",
+                    [checkov_cmd, '--directory', terraform_dir, '--output', 'json'],
+                    timeout=_CHECKOV_TIMEOUT
+                )
+                stdout = result.stdout
             
             # Checkov returns non-zero exit code when issues are found, but that's normal
-            if result.stdout:
-                checkov_output = json.loads(result.stdout)
-            else:
-                checkov_output = {"results": {"failed_checks": [], "passed_checks": []}}
-            
-            # Extract results - handle both single result and multiple results formats
-            if "results" in checkov_output:
-                results_data = checkov_output["results"]
-                if isinstance(results_data, dict):
-                    # Single result format (current case)
-                    failed_checks = results_data.get("failed_checks", [])
-                    passed_checks = results_data.get("passed_checks", [])
-                elif isinstance(results_data, list) and len(results_data) > 0:
-                    # Multiple results format - take the first one (terraform)
-                    terraform_results = results_data[0]
-                    failed_checks = terraform_results.get("failed_checks", [])
-                    passed_checks = terraform_results.get("passed_checks", [])
-                else:
-                    failed_checks = []
-                    passed_checks = []
-            else:
-                failed_checks = []
-                passed_checks = []
-            
-            # Count severity levels
-            severity_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
-            for check in failed_checks:
-                severity = check.get("severity")
-                if severity:
-                    severity_lower = severity.lower()
-                    if severity_lower in severity_counts:
-                        severity_counts[severity_lower] += 1
-                    else:
-                        severity_counts["medium"] += 1  # Default to medium if unknown
-                else:
-                    severity_counts["medium"] += 1  # Default to medium if None
+            failed_checks, passed_checks = _extract_checkov_checks(stdout)
+            
+            # Count severity levels, defaulting to medium if unknown or None
+            counts = Counter(_SEVERITY_CANON.get(check.get("severity"), "medium") for check in failed_checks)
+            severity_counts = {level: counts[level] for level in _SEVERITY_LEVELS}
             
             # Format results
             formatted_results = {
@@ -158,12 +618,16 @@ class StaticChecker:
                 "passed_checks": len(passed_checks),
                 "total_checks": len(failed_checks) + len(passed_checks),
                 "results": {
-                    "failed": failed_checks,
-                    "passed": passed_checks
+                    "failed": failed_checks if self.keep_details else [],
+                    "passed": passed_checks if self.keep_details else []
                 },
                 "summary": severity_counts
             }
             
+            # Without details the findings stay on disk for get_raw_findings
+            if not self.keep_details:
+                formatted_results["raw_results_file"] = self._save_raw_findings(stdout)
+            
             return formatted_results
             
         except subprocess.TimeoutExpired:
@@ -203,6 +667,323 @@ class StaticChecker:
                 "total_checks": 0
             }
     
+    def _new_raw_findings_path(self) -> str:
+        """
+        Reserve a file for a Checkov report in this checker's temporary directory
+        
+        Returns:
+            Path for the raw findings file
+        """
+        if self._raw_findings_dir is None:
+            self._raw_findings_dir = tempfile.mkdtemp(prefix='iac-checkov-')
+        self._raw_findings_count += 1
+        return os.path.join(self._raw_findings_dir, f"checkov-{self._raw_findings_count}.json")
+    
+    def _save_raw_findings(self, stdout) -> Optional[str]:
+        """
+        Write raw Checkov output to disk so the findings can be loaded on demand
+        
+        Args:
+            stdout: Checkov JSON output as str or bytes
+            
+        Returns:
+            Path of the raw findings file, or None if it could not be written
+        """
+        try:
+            raw_results_file = self._new_raw_findings_path()
+            with open(raw_results_file, 'wb') as raw_file:
+                raw_file.write(stdout.encode('utf-8') if isinstance(stdout, str) else stdout or b"")
+        except OSError:
+            return None
+        return raw_results_file
+    
+    def get_raw_findings(self, analysis_index: int = -1) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """
+        Load the Checkov findings of an analysis run with keep_details=False
+        
+        Args:
+            analysis_index: Index into the analysis history, latest by default
+            
+        Returns:
+            Dictionary with failed and passed check lists, or None if the
+            findings are not available
+        """
+        try:
+            checkov_result = self.results[analysis_index].get("results", {}).get("checkov", {})
+        except IndexError:
+            return None
+        
+        raw_results_file = checkov_result.get("raw_results_file")
+        if not raw_results_file:
+            return None
+        try:
+            failed_checks, passed_checks = _extract_checkov_checks(Path(raw_results_file).read_bytes())
+        except (OSError, ValueError):
+            return None
+        return {"failed": failed_checks, "passed": passed_checks}
+    
+    def _start_tool_process(self, tool: str, command: List[str], **popen_kwargs) -> subprocess.Popen:
+        """
+        Start a tool process and track it so the analysis can cancel it
+        
+        Args:
+            tool: Tool name the process belongs to
+            command: Command line to run
+            **popen_kwargs: Extra arguments for subprocess.Popen
+            
+        Returns:
+            Started process
+        """
+        # A separate session lets a timeout or cancellation kill everything the
+        # tool spawned, such as provider plugins, not just the direct child
+        if not _IS_WINDOWS:
+            popen_kwargs.setdefault('start_new_session', True)
+        
+        with self._process_lock:
+            if tool in self._cancelled_tools:
+                raise _ToolCancelled(f"{tool} was cancelled")
+            process = subprocess.Popen(command, **popen_kwargs)
+            self._tool_processes[tool] = process
+        return process
+    
+    def _finish_tool_process(self, tool: str):
+        """
+        Stop tracking a tool process that has exited
+        
+        Args:
+            tool: Tool name the process belongs to
+        """
+        with self._process_lock:
+            self._tool_processes.pop(tool, None)
+    
+    def _run_tool_process(self, tool: str, command: List[str], timeout: int,
+                          **popen_kwargs) -> subprocess.CompletedProcess:
+        """
+        Run a tool and capture its output like subprocess.run, allowing cancellation
+        
+        Args:
+            tool: Tool name the process belongs to
+            command: Command line to run
+            timeout: Seconds to wait before killing the tool
+            **popen_kwargs: Extra arguments for subprocess.Popen, such as cwd and env
+            
+        Returns:
+            Completed process with bytes stdout and stderr
+        """
+        process = self._start_tool_process(
+            tool, command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, **popen_kwargs
+        )
+        with process:
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                _kill_process_group(process, _KILL_GRACE_SECONDS)
+                process.communicate()
+                raise
+            finally:
+                self._finish_tool_process(tool)
+        return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
+    
+    def _cancel_tools(self, tools: Tuple[str, ...]):
+        """
+        Cancel tools for the current analysis, killing any that are running
+        
+        Args:
+            tools: Names of the tools to cancel
+        """
+        with self._process_lock:
+            self._cancelled_tools.update(tools)
+            for tool in tools:
+                process = self._tool_processes.get(tool)
+                if process is not None and process.poll() is None:
+                    _kill_process_group(process)
+    
+    def _run_checkov_worker(self, terraform_dir: str) -> Optional[str]:
+        """
+        Run Checkov in the persistent worker process, starting it if needed
+        
+        Args:
+            terraform_dir: Directory containing Terraform files
+            
+        Returns:
+            Checkov JSON output, or None if the worker is unavailable
+            
+        Raises:
+            RuntimeError: If Checkov failed inside the worker
+        """
+        with self._checkov_worker_lock:
+            if self._checkov_worker_failed or "checkov" in self._cancelled_tools:
+                return None
+            
+            worker = self._checkov_worker
+            if worker is None or worker.poll() is not None:
+                try:
+                    worker = subprocess.Popen(
+                        [sys.executable, '-c', _CHECKOV_WORKER_SCRIPT],
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        text=True
+                    )
+                except OSError:
+                    self._checkov_worker_failed = True
+                    return None
+                self._checkov_worker = worker
+            
+            timed_out = threading.Event()
+            
+            def kill_on_timeout():
+                timed_out.set()
+                worker.kill()
+            
+            timer = threading.Timer(_CHECKOV_TIMEOUT, kill_on_timeout)
+            timer.start()
+            try:
+                worker.stdin.write(os.path.abspath(terraform_dir) + "\n")
+                worker.stdin.flush()
+                lines = []
+                error_message = None
+                for line in iter(worker.stdout.readline, ''):
+                    if line.rstrip("\n") == _CHECKOV_WORKER_SENTINEL:
+                        if error_message is None:
+                            return "".join(lines)
+                        break
+                    if line.startswith(_CHECKOV_WORKER_ERROR):
+                        error_message = line[len(_CHECKOV_WORKER_ERROR):].strip()
+                    lines.append(line)
+            except OSError:
+                pass
+            finally:
+                timer.cancel()
+            
+            # Checkov raised; a fresh interpreter avoids reusing its half-updated state
+            if error_message is not None:
+                self._stop_checkov_worker()
+                raise RuntimeError(error_message)
+            
+            # The worker died before answering; fall back to one-shot runs
+            self._stop_checkov_worker()
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(_CHECKOV_CMD, _CHECKOV_TIMEOUT)
+            self._checkov_worker_failed = True
+            return None
+    
+    def _stop_checkov_worker(self):
+        """Stop the persistent Checkov worker, if one is running"""
+        worker = self._checkov_worker
+        self._checkov_worker = None
+        if worker is None:
+            return
+        for stream in (worker.stdin, worker.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+        if worker.poll() is None:
+            worker.terminate()
+            try:
+                worker.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                worker.kill()
+                worker.wait()
+    
+    def close(self):
+        """Stop the persistent Checkov worker and remove saved raw findings"""
+        with self._checkov_worker_lock:
+            self._stop_checkov_worker()
+        self._use_checkov_worker = False
+        self._remove_raw_findings()
+    
+    def _remove_raw_findings(self):
+        """Delete the temporary directory holding raw Checkov findings"""
+        if self._raw_findings_dir is not None:
+            shutil.rmtree(self._raw_findings_dir, ignore_errors=True)
+            self._raw_findings_dir = None
+    
+    def __enter__(self):
+        self._use_checkov_worker = True
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __del__(self):
+        if getattr(self, '_checkov_worker', None) is not None:
+            self._stop_checkov_worker()
+        if getattr(self, '_raw_findings_dir', None) is not None:
+            self._remove_raw_findings()
+    
+    def _run_checkov_streaming(self, checkov_cmd: str, terraform_dir: str) -> Dict[str, Any]:
+        """
+        Run Checkov and count its checks while the JSON output is still streaming
+        
+        Only counts are kept, so memory use does not grow with the size of
+        Checkov's report.
+        
+        Args:
+            checkov_cmd: Checkov executable
+            terraform_dir: Directory containing Terraform files
+            
+        Returns:
+            Dictionary containing security analysis counts
+        """
+        timed_out = threading.Event()
+        
+        def kill_on_timeout():
+            timed_out.set()
+            _kill_process_group(process, _KILL_GRACE_SECONDS)
+        
+        raw_results_file = self._new_raw_findings_path()
+        process = self._start_tool_process(
+            "checkov",
+            [checkov_cmd, '--directory', terraform_dir, '--output', 'json'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        with process, open(raw_results_file, 'wb') as raw_file:
+            timer = threading.Timer(_CHECKOV_TIMEOUT, kill_on_timeout)
+            timer.start()
+            try:
+                # Log lines ahead of the report are skipped like in the in-memory path
+                head = _read_to_json_document(process.stdout)
+                if head:
+                    # Copy the report to disk as it is parsed, for get_raw_findings
+                    failed_count, passed_count, severity_counts = _count_checkov_stream(
+                        _TeeReader(process.stdout, raw_file, head)
+                    )
+                else:
+                    failed_count, passed_count = 0, 0
+                    severity_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+                # Checkov may close stdout before it exits; the armed timer bounds this wait
+                process.wait()
+            except ijson.JSONError:
+                if timed_out.is_set():
+                    raise subprocess.TimeoutExpired(checkov_cmd, _CHECKOV_TIMEOUT)
+                raise json.JSONDecodeError("Invalid Checkov JSON output", "", 0)
+            finally:
+                timer.cancel()
+                # Popen.__exit__ waits without a timeout, so never leave Checkov running
+                if process.poll() is None:
+                    _kill_process_group(process)
+                self._finish_tool_process("checkov")
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(checkov_cmd, _CHECKOV_TIMEOUT)
+        
+        return {
+            "tool": "checkov",
+            "status": "success",
+            "failed_checks": failed_count,
+            "passed_checks": passed_count,
+            "total_checks": failed_count + passed_count,
+            "results": {
+                "failed": [],
+                "passed": []
+            },
+            "summary": severity_counts,
+            "raw_results_file": raw_results_file
+        }
+    
     def _run_terraform_validate(self, terraform_dir: str) -> Dict[str, Any]:
         """
         Run terraform validate to check syntax and configuration
@@ -214,27 +995,37 @@ class StaticChecker:
             Dictionary containing validation results
         """
         try:
+            env = self._terraform_env()
+            
             # First, initialize terraform if needed
-            init_result = subprocess.run(
-                ['terraform', 'init', '-backend=false'],
-                cwd=terraform_dir,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            ran_init = self._needs_init(terraform_dir)
+            if ran_init:
+                self._run_terraform_init(terraform_dir, env)
             
             # Run terraform validate
-            validate_result = subprocess.run(
+            validate_result = self._run_tool_process(
+                "terraform",
                 ['terraform', 'validate', '-json'],
+                timeout=30,
                 cwd=terraform_dir,
-                capture_output=True,
-                text=True,
-                timeout=30
+                env=env
             )
             
+            # The skipped init was needed after all, so run it and validate again
+            if (validate_result.returncode != 0 and not ran_init and
+                    _INIT_REQUIRED_MARKER in validate_result.stdout + validate_result.stderr):
+                self._run_terraform_init(terraform_dir, env)
+                validate_result = self._run_tool_process(
+                    "terraform",
+                    ['terraform', 'validate', '-json'],
+                    timeout=30,
+                    cwd=terraform_dir,
+                    env=env
+                )
+            
             if validate_result.returncode == 0:
                 if validate_result.stdout:
-                    validate_output = json.loads(validate_result.stdout)
+                    validate_output = _json_loads(validate_result.stdout)
                 else:
                     validate_output = {"valid": True}
                 
@@ -247,14 +1038,24 @@ class StaticChecker:
                     "warning_count": validate_output.get("warning_count", 0)
                 }
             else:
+                # validate -json exits non-zero on invalid configuration but still
+                # prints its diagnostics; init and other failures leave stdout empty
+                try:
+                    if validate_result.stdout.lstrip()[:1] == b'{':
+                        validate_output = _json_loads(validate_result.stdout)
+                    else:
+                        validate_output = {}
+                except ValueError:
+                    validate_output = {}
+                
                 return {
                     "tool": "terraform_validate",
                     "status": "error",
                     "valid": False,
-                    "error_message": validate_result.stderr,
-                    "diagnostics": [],
-                    "error_count": 1,
-                    "warning_count": 0
+                    "error_message": validate_result.stderr.decode('utf-8', errors='replace'),
+                    "diagnostics": validate_output.get("diagnostics", []),
+                    "error_count": validate_output.get("error_count", 1),
+                    "warning_count": validate_output.get("warning_count", 0)
                 }
                 
         except subprocess.TimeoutExpired:
@@ -288,14 +1089,90 @@ class StaticChecker:
                 "warning_count": 0
             }
     
+    def _needs_init(self, terraform_dir: str) -> bool:
+        """
+        Check whether terraform init has to run before validate
+        
+        Init is skipped when providers are installed and every configuration
+        file in the root module is no newer than the last successful init. The
+        init sentinel records that time; without it the lock file is used,
+        since terraform only rewrites the lock file when providers change.
+        
+        Args:
+            terraform_dir: Directory containing Terraform files
+            
+        Returns:
+            True if terraform init should run
+        """
+        if not os.path.isdir(os.path.join(terraform_dir, '.terraform', 'providers')):
+            return True
+        try:
+            try:
+                initialized_mtime = os.stat(os.path.join(terraform_dir, _INIT_SENTINEL)).st_mtime_ns
+            except FileNotFoundError:
+                initialized_mtime = os.stat(os.path.join(terraform_dir, '.terraform.lock.hcl')).st_mtime_ns
+            with os.scandir(terraform_dir) as entries:
+                for entry in entries:
+                    if (entry.name.endswith(TF_SUFFIXES) and entry.is_file() and
+                            entry.stat().st_mtime_ns > initialized_mtime):
+                        return True
+        except OSError:
+            return True
+        return False
+    
+    def _run_terraform_init(self, terraform_dir: str, env: Dict[str, str]) -> subprocess.CompletedProcess:
+        """
+        Run terraform init without configuring a backend
+        
+        A successful init touches the init sentinel so later runs can skip it.
+        
+        Args:
+            terraform_dir: Directory containing Terraform files
+            env: Environment for the terraform subprocess
+            
+        Returns:
+            Completed terraform init process
+        """
+        init_result = self._run_tool_process(
+            "terraform",
+            ['terraform', 'init', '-backend=false', '-input=false'],
+            timeout=60,
+            cwd=terraform_dir,
+            env=env
+        )
+        if init_result.returncode == 0:
+            try:
+                Path(terraform_dir, _INIT_SENTINEL).touch()
+            except OSError:
+                pass
+        return init_result
+    
+    def _terraform_env(self) -> Dict[str, str]:
+        """
+        Build the environment for terraform commands with a shared plugin cache
+        
+        Returns:
+            Environment variables for the terraform subprocesses
+        """
+        env = dict(os.environ)
+        # Respect a plugin cache the user already configured
+        if not env.get("TF_PLUGIN_CACHE_DIR"):
+            env["TF_PLUGIN_CACHE_DIR"] = _TF_PLUGIN_CACHE_DIR
+        try:
+            os.makedirs(env["TF_PLUGIN_CACHE_DIR"], exist_ok=True)
+        except OSError:
+            # terraform only warns about an unusable cache directory, so init still works
+            pass
+        return env
+    
     def _get_timestamp(self) -> str:
         """Get current timestamp in ISO format"""
-        from datetime import datetime
-        return datetime.now().isoformat()
+        return utc_timestamp()
     
     def _determine_overall_status(self, validate_result: Dict[str, Any], 
                                  tflint_result: Dict[str, Any], 
-                                 checkov_result: Dict[str, Any]) -> str:
+                                 checkov_result: Dict[str, Any],
+                                 issue_counts: Optional[IssueCounts] = None) -> str:
         """
         Determine overall status based on all tool results
         
@@ -303,15 +1180,16 @@ class StaticChecker:
             validate_result: Terraform validate results
             tflint_result: TFLint results
             checkov_result: Checkov results
+            issue_counts: Precomputed IssueCounts.from_results, if available
             
         Returns:
             Overall status string
         """
         # Check if any critical tool failed to run
         critical_tool_failures = (
-            validate_result.get("status") not in ["success"] or
-            (tflint_result.get("status") not in ["success", "not_found"]) or
-            (checkov_result.get("status") not in ["success", "not_found"])
+            validate_result.get("status") != "success" or
+            tflint_result.get("status") not in _NON_FAILING_TOOL_STATUSES or
+            checkov_result.get("status") not in _NON_FAILING_TOOL_STATUSES
         )
         
         if critical_tool_failures:
@@ -321,38 +1199,24 @@ class StaticChecker:
         if not validate_result.get("valid", False):
             return "VALIDATION_FAILED"
         
-        # Count critical issues
-        critical_issues = (
-            validate_result.get("error_count", 0) +
-            checkov_result.get("summary", {}).get("critical", 0) +
-            checkov_result.get("summary", {}).get("high", 0)
-        )
-        
-        # Add TFLint issues (treat all as medium for now)
-        tflint_issues = tflint_result.get("total_issues", 0)
+        if issue_counts is None:
+            issue_counts = IssueCounts.from_results(validate_result, tflint_result, checkov_result)
         
-        if critical_issues > 0:
+        if issue_counts.critical > 0:
             return "CRITICAL_ISSUES"
         
-        # Count medium/low issues
-        medium_issues = (
-            validate_result.get("warning_count", 0) +
-            checkov_result.get("summary", {}).get("medium", 0) +
-            checkov_result.get("summary", {}).get("low", 0) +
-            tflint_issues
-        )
-        
-        if medium_issues > 0:
+        if issue_counts.medium > 0:
             return "NEEDS_ATTENTION"
         
         return "PASSED"
     
-    def analyze_terraform_files(self, terraform_dir: str) -> Dict[str, Any]:
+    def analyze_terraform_files(self, terraform_dir: str, force: bool = False) -> Dict[str, Any]:
         """
         Perform comprehensive static analysis on Terraform files
         
         Args:
             terraform_dir: Directory containing Terraform files
+            force: Re-run the tools even if cached results are available
             
         Returns:
             Combined analysis results
@@ -364,34 +1228,119 @@ class StaticChecker:
                 "results": {}
             }
         
-        # Check if directory contains Terraform files
-        terraform_files = []
-        for root, dirs, files in os.walk(terraform_dir):
-            for file in files:
-                if file.endswith('.tf'):
-                    terraform_files.append(os.path.join(root, file))
+        # Check if directory contains Terraform files; stop at the first one
+        terraform_file_iter = (entry.path for entry in iter_terraform_files(terraform_dir))
+        first_file = next(terraform_file_iter, None)
         
-        if not terraform_files:
+        if first_file is None:
             return {
                 "status": "error",
                 "error_message": f"No Terraform files found in {terraform_dir}",
                 "results": {}
             }
         
-        # Run terraform validate first
-        validate_result = self._run_terraform_validate(terraform_dir)
+        # Reuse each tool's earlier result when neither the Terraform files nor
+        # that tool's version have changed, so a Checkov upgrade does not re-run
+        # TFLint. The lookup needs the complete file list up front; otherwise
+        # the rest of the walk overlaps the tools
+        file_count = None
+        cache_keys = None
+        tool_results = {}
+        if self.use_cache and not force:
+            terraform_files = [first_file, *terraform_file_iter]
+            file_count = len(terraform_files)
+            cache_keys = self._tool_cache_keys(terraform_dir, terraform_files)
+            for tool, cache_key in cache_keys.items():
+                cached_result = self._read_results_cache(cache_key)
+                if cached_result is not None:
+                    tool_results[tool] = cached_result
+        
+        cached_validate = tool_results.get("terraform_validate")
+        validation_broken = (
+            cached_validate is not None and
+            self.skip_on_validate_failure and
+            _validation_broken(cached_validate)
+        )
+        pending_tools = [] if validation_broken else [tool for tool in _RESULT_TOOLS if tool not in tool_results]
+        
+        if pending_tools:
+            with self._process_lock:
+                self._cancelled_tools.clear()
+            
+            tool_runners = {
+                "terraform_validate": self._run_terraform_validate,
+                "tflint": self.run_tflint,
+                "checkov": self.run_checkov
+            }
+            
+            # The three tools are independent external processes, so run them
+            # concurrently; each keeps its own subprocess timeout. IAC_PARALLEL=0
+            # or workers=1 runs them one after another in the same order
+            if self.workers is not None:
+                max_workers = max(1, min(self.workers, len(pending_tools)))
+            elif os.environ.get("IAC_PARALLEL", "1") != "0":
+                max_workers = len(pending_tools)
+            else:
+                max_workers = 1
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    tool: executor.submit(tool_runners[tool], terraform_dir)
+                    for tool in pending_tools
+                }
+                
+                try:
+                    # Finish discovery while the tools run; the paths are only
+                    # kept when the cache keys need them
+                    if file_count is None and self.use_cache:
+                        terraform_files = [first_file, *terraform_file_iter]
+                        file_count = len(terraform_files)
+                        cache_keys = self._tool_cache_keys(terraform_dir, terraform_files)
+                    elif file_count is None:
+                        file_count = 1 + sum(1 for _ in terraform_file_iter)
+                    
+                    if "terraform_validate" in futures:
+                        tool_results["terraform_validate"] = futures["terraform_validate"].result()
+                        
+                        # Linting and security checks on configuration that does not
+                        # validate only produce noise, so stop them early
+                        validation_broken = (
+                            self.skip_on_validate_failure and
+                            _validation_broken(tool_results["terraform_validate"])
+                        )
+                        if validation_broken:
+                            self._cancel_tools(("tflint", "checkov"))
+                    
+                    for tool in ("tflint", "checkov"):
+                        if tool in futures:
+                            tool_results[tool] = futures[tool].result()
+                except BaseException:
+                    # Tools run in their own sessions and miss the terminal's Ctrl+C
+                    self._cancel_tools(("terraform", "tflint", "checkov"))
+                    raise
+            
+            # Tool failures may be transient, so only cache complete tool results
+            if cache_keys is not None:
+                for tool in pending_tools:
+                    tool_result = tool_results[tool]
+                    if tool_result.get("status") in _CACHEABLE_TOOL_STATUSES:
+                        self._write_results_cache(cache_keys[tool], tool_result)
         
-        # Run TFLint
-        tflint_result = self.run_tflint(terraform_dir)
+        validate_result = tool_results["terraform_validate"]
+        if validation_broken:
+            tflint_result = _not_run_result("tflint")
+            checkov_result = _not_run_result("checkov")
+        else:
+            tflint_result = tool_results["tflint"]
+            checkov_result = tool_results["checkov"]
         
-        # Run Checkov
-        checkov_result = self.run_checkov(terraform_dir)
+        # Read each count once and share it between the summary and the status
+        issue_counts = IssueCounts.from_results(validate_result, tflint_result, checkov_result)
         
         # Combine results
         combined_results = {
             "status": "success",
             "terraform_directory": terraform_dir,
-            "terraform_files_found": len(terraform_files),
+            "terraform_files_found": file_count,
             "analysis_timestamp": self._get_timestamp(),
             "results": {
                 "terraform_validate": validate_result,
@@ -399,31 +1348,219 @@ class StaticChecker:
                 "checkov": checkov_result
             },
             "summary": {
-                "total_issues": (
-                    validate_result.get("error_count", 0) +
-                    validate_result.get("warning_count", 0) +
-                    tflint_result.get("total_issues", 0) + 
-                    checkov_result.get("failed_checks", 0)
-                ),
-                "critical_issues": (
-                    validate_result.get("error_count", 0) +
-                    checkov_result.get("summary", {}).get("critical", 0) +
-                    checkov_result.get("summary", {}).get("high", 0)
-                ),
+                "total_issues": issue_counts.total,
+                "critical_issues": issue_counts.critical,
                 "validation_passed": validate_result.get("valid", False),
-                "linting_issues": tflint_result.get("total_issues", 0),
-                "security_issues": checkov_result.get("failed_checks", 0),
+                "linting_issues": issue_counts.linting,
+                "security_issues": issue_counts.security,
                 "overall_status": self._determine_overall_status(
-                    validate_result, tflint_result, checkov_result
+                    validate_result, tflint_result, checkov_result, issue_counts
                 )
             }
         }
         
         # Store results for later use
-        self.results.append(combined_results)
+        self._record_result(combined_results)
         
         return combined_results
     
+    def _record_result(self, combined_results: Dict[str, Any]):
+        """
+        Add an analysis to the history without its per-finding details
+        
+        Args:
+            combined_results: Combined analysis results returned to the caller
+        """
+        history_entry = dict(combined_results)
+        history_entry["results"] = {
+            tool: {key: value for key, value in tool_result.items() if key not in _HISTORY_DETAIL_KEYS}
+            for tool, tool_result in combined_results.get("results", {}).items()
+        }
+        # The raw findings of the entry about to be evicted are no longer reachable
+        if self.results.maxlen is not None and len(self.results) == self.results.maxlen:
+            evicted = self.results[0] if self.results else history_entry
+            raw_results_file = evicted.get("results", {}).get("checkov", {}).get("raw_results_file")
+            if raw_results_file:
+                try:
+                    os.remove(raw_results_file)
+                except OSError:
+                    pass
+        
+        self.results.append(history_entry)
+        self._analysis_count += 1
+    
+    def _tool_cache_keys(self, terraform_dir: str, terraform_files: List[str]) -> Dict[str, str]:
+        """
+        Build the cache key of each tool's result from the sources and its version
+        
+        Args:
+            terraform_dir: Directory containing Terraform files
+            terraform_files: Terraform files found in the directory
+            
+        Returns:
+            Mapping of result name to hex digest identifying that tool's inputs
+        """
+        fingerprint = self._compute_dir_fingerprint(terraform_dir, terraform_files)
+        cache_keys = {}
+        for tool, version_tool in _RESULT_TOOLS.items():
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(f"{fingerprint}\0{tool}={_tool_version(version_tool)}\0".encode('utf-8'))
+            # Only Checkov's result layout depends on keep_details
+            if tool == "checkov":
+                digest.update(f"details={self.keep_details}\0".encode('utf-8'))
+            cache_keys[tool] = digest.hexdigest()
+        return cache_keys
+    
+    def _compute_dir_fingerprint(self, terraform_dir: str, terraform_files: List[str]) -> str:
+        """
+        Fingerprint every input an analysis depends on
+        
+        Besides the Terraform sources this covers the provider lock file,
+        variable files, TFLint and Checkov configuration and the sources of
+        local modules outside the directory, since any of them can change the
+        tool results.
+        
+        Args:
+            terraform_dir: Directory containing Terraform files
+            terraform_files: Terraform files found in the directory
+            
+        Returns:
+            Hex digest identifying the analysis inputs
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        root = os.path.abspath(terraform_dir)
+        digest.update(f"v{_RESULTS_CACHE_VERSION}\0{root}\0".encode('utf-8'))
+        
+        # The lock file pins provider versions, which affect terraform validate
+        lock_file = os.path.join(terraform_dir, '.terraform.lock.hcl')
+        input_files = sorted(terraform_files)
+        input_files.extend(sorted(
+            entry.path for entry in iter_terraform_files(terraform_dir, _TFVARS_SUFFIXES)
+        ))
+        if os.path.isfile(lock_file):
+            input_files.append(lock_file)
+        
+        # Follow local module sources; modules inside the directory are already covered
+        pending_files = list(terraform_files)
+        seen_modules = set()
+        while pending_files:
+            for source in self._file_inputs(pending_files.pop())[1]:
+                module_dir = os.path.normpath(source)
+                if (module_dir in seen_modules or not os.path.isdir(module_dir) or
+                        os.path.commonpath([root, module_dir]) == root):
+                    continue
+                seen_modules.add(module_dir)
+                module_files = sorted(entry.path for entry in iter_terraform_files(module_dir))
+                input_files.extend(module_files)
+                pending_files.extend(module_files)
+        
+        for filepath in input_files:
+            digest.update(os.path.relpath(filepath, terraform_dir).encode('utf-8') + b"\0")
+            digest.update(self._file_digest(filepath))
+        
+        # Configuration outside the directory is keyed by its absolute path
+        for filepath in _tool_config_files(terraform_dir):
+            digest.update(filepath.encode('utf-8') + b"\0")
+            digest.update(self._file_digest(filepath))
+        
+        return digest.hexdigest()
+    
+    def _file_digest(self, filepath: str) -> bytes:
+        """
+        Hash a file's contents, reusing the digest while its mtime and size are unchanged
+        
+        Args:
+            filepath: File to hash
+            
+        Returns:
+            Content digest, or a null byte if the file cannot be read
+        """
+        return self._file_inputs(filepath)[0]
+    
+    def _file_inputs(self, filepath: str) -> Tuple[bytes, Tuple[str, ...]]:
+        """
+        Hash a file and find the local modules it uses, cached on its mtime and size
+        
+        Args:
+            filepath: File to read
+            
+        Returns:
+            Tuple of (content digest or a null byte if the file cannot be read,
+            absolute paths of local module sources in Terraform files)
+        """
+        try:
+            stat = os.stat(filepath)
+            key = (stat.st_mtime_ns, stat.st_size)
+            cached = self._file_digests.get(filepath)
+            if cached is not None and cached[0] == key:
+                return cached[1]
+            with open(filepath, 'rb') as file:
+                content = file.read()
+        except OSError:
+            return b"\0", ()
+        
+        module_sources = ()
+        if filepath.endswith(TF_SUFFIXES):
+            base_dir = os.path.dirname(os.path.abspath(filepath))
+            module_sources = tuple(
+                os.path.join(base_dir, source.decode('utf-8', errors='replace'))
+                for source in _LOCAL_MODULE_SOURCE.findall(content)
+            )
+        file_inputs = (hashlib.blake2b(content, digest_size=16).digest(), module_sources)
+        self._file_digests[filepath] = (key, file_inputs)
+        return file_inputs
+    
+    def _results_cache_path(self, cache_key: str) -> Path:
+        """
+        Get the cache file for a tool result cache key
+        
+        Args:
+            cache_key: Tool result cache key
+            
+        Returns:
+            Path of the JSON cache file
+        """
+        cache_root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        return Path(cache_root) / 'iac-framework' / f"static-{cache_key}.json"
+    
+    def _read_results_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a cached tool result
+        
+        Args:
+            cache_key: Tool result cache key
+            
+        Returns:
+            Cached tool result, or None if there is no usable cache entry
+        """
+        try:
+            cached = _json_loads(self._results_cache_path(cache_key).read_bytes())
+        except Exception:
+            return None
+        return cached if isinstance(cached, dict) else None
+    
+    def _write_results_cache(self, cache_key: str, tool_result: Dict[str, Any]):
+        """
+        Write a tool result to the cache, ignoring any filesystem errors
+        
+        Args:
+            cache_key: Tool result cache key
+            tool_result: Result of a single tool
+        """
+        # Raw findings files are temporary and must not outlive this checker
+        if "raw_results_file" in tool_result:
+            tool_result = {key: value for key, value in tool_result.items() if key != "raw_results_file"}
+        
+        try:
+            cache_path = self._results_cache_path(cache_key)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a sibling file first so concurrent runs never read a partial cache
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(tool_result), encoding='utf-8')
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            pass
+    
     def get_results_summary(self) -> Dict[str, Any]:
         """
         Get summary of all analysis results
@@ -435,12 +1572,13 @@ class StaticChecker:
             return {"message": "No analysis results available"}
         
         latest_result = self.results[-1]
+        latest_summary = latest_result.get("summary") or {}
         return {
-            "total_analyses": len(self.results),
+            "total_analyses": self._analysis_count,
             "latest_analysis": {
                 "timestamp": latest_result.get("analysis_timestamp"),
-                "status": latest_result.get("summary", {}).get("overall_status"),
-                "total_issues": latest_result.get("summary", {}).get("total_issues", 0),
-                "validation_passed": latest_result.get("summary", {}).get("validation_passed", False)
+                "status": latest_summary.get("overall_status"),
+                "total_issues": latest_summary.get("total_issues", 0),
+                "validation_passed": latest_summary.get("validation_passed", False)
             }
         }
@@ -4,30 +4,160 @@ Unit tests for IaC Testing Framework
 """
 
 import unittest
+from unittest import mock
 import json
 import tempfile
+import gzip
+import io
 import os
+import pstats
+import subprocess
 from pathlib import Path
 import sys
+import time
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library serializer
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # Only .gz output is tested without it
+    zstandard = None
 
 # Add the project root to the Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
+import test_runner
+from static_analysis import static_checker
 from static_analysis.static_checker import StaticChecker
-from policy_compliance.compliance_checker import ComplianceChecker
+from policy_compliance.compliance_checker import ComplianceChecker, compile_policy
+from simple_resource_reporter import SimpleResourceReporter
+
+
+# Stand-ins for terraform, tflint and checkov that log each call to
+# $IAC_FAKE_LOG; IAC_FAKE_VALIDATE, IAC_FAKE_SLEEP and IAC_FAKE_CHECKOV_LOGS
+# (log lines before the report, or instead of it with "only") steer their behaviour
+FAKE_TOOLS = {
+    "terraform": """#!/bin/sh
+echo "terraform $*" >> "$IAC_FAKE_LOG"
+case "$1" in
+  version) echo '{"terraform_version":"1.6.0"}';;
+  init) mkdir -p .terraform/providers .terraform/modules && echo "Initialized";;
+  validate)
+    case "$IAC_FAKE_VALIDATE" in
+      invalid) echo '{"valid":false,"error_count":1,"warning_count":0,"diagnostics":[{"severity":"error"}]}'; exit 1;;
+      needs_init) [ -d .terraform/modules ] || { echo 'Error: Module not installed. Run "terraform init"' >&2; exit 1; }
+        echo '{"valid":true,"error_count":0,"warning_count":0,"diagnostics":[]}';;
+      broken) echo 'Error: fake failure' >&2; exit 1;;
+      *) echo '{"valid":true,"error_count":0,"warning_count":0,"diagnostics":[]}';;
+    esac;;
+esac
+""",
+    "tflint": """#!/bin/sh
+echo "tflint $*" >> "$IAC_FAKE_LOG"
+case "$1" in
+  --version) echo "TFLint version 0.50.0";;
+  *) sleep "${IAC_FAKE_SLEEP:-0}"; echo '{"issues":[]}';;
+esac
+""",
+    "checkov": """#!/bin/sh
+echo "checkov $*" >> "$IAC_FAKE_LOG"
+case "$1" in
+  --version) echo "3.0.0";;
+  *) sleep "${IAC_FAKE_SLEEP:-0}"
+    if [ -n "$IAC_FAKE_CHECKOV_LOGS" ]; then
+      echo "2026-01-01 12:00:00,000 [MainThread  ] [WARNI]  Failed to download module"
+      echo "[INFO] Scanning directory"
+      [ "$IAC_FAKE_CHECKOV_LOGS" = only ] && exit 0
+    fi
+    echo '{"results":{"failed_checks":[{"check_id":"CKV_1","severity":"HIGH"},{"check_id":"CKV_2","severity":null},{"check_id":"CKV_3","severity":"Low"}],"passed_checks":[{"check_id":"CKV_4"}]}}'
+    # Close stdout but keep running, like a Checkov stuck on shutdown
+    [ -n "$IAC_FAKE_CHECKOV_LINGER" ] && { exec >&-; sleep 30; };;
+esac
+""",
+}
+
+# Stand-in for an OPA server: answers /health and denies every input with a
+# name; IAC_FAKE_OPA_FAIL_ONCE makes the first start exit as if the port was
+# taken, and a policy without a package line fails to compile
+FAKE_OPA = "#!" + sys.executable + """
+import json
+import os
+import sys
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+def log(message):
+    with open(os.environ["IAC_FAKE_LOG"], "a") as log_file:
+        log_file.write(message + "\\n")
+
+log("opa " + " ".join(sys.argv[1:]))
+marker = os.environ.get("IAC_FAKE_OPA_FAIL_ONCE")
+if marker and not os.path.exists(marker):
+    open(marker, "w").close()
+    sys.stderr.write("error: listen tcp 127.0.0.1: bind: address already in use\\n")
+    sys.exit(1)
+with open(sys.argv[-1]) as policy_file:
+    if not policy_file.read().startswith("package "):
+        sys.stderr.write("error: 1 error occurred: " + sys.argv[-1] + ":1: rego_parse_error: package expected\\n")
+        sys.exit(1)
+host, port = sys.argv[sys.argv.index("--addr") + 1].rsplit(":", 1)
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    
+    def reply(self, document):
+        body = json.dumps(document).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def do_GET(self):
+        self.reply({})
+    
+    def do_POST(self):
+        log("opa-query " + self.path)
+        document = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["input"]
+        self.reply({"result": ["deny " + document["name"]]} if "name" in document else {})
+    
+    def log_message(self, *args):
+        pass
+
+HTTPServer((host, int(port)), Handler).serve_forever()
+"""
+
+
+def examples_dir() -> Path:
+    """Terraform examples directory, or the per-session copy made by conftest.py"""
+    copied_dir = os.environ.get("IAC_TEST_EXAMPLES_DIR")
+    if copied_dir:
+        return Path(copied_dir)
+    return Path(__file__).parent / "static_analysis" / "examples"
+
 
 class TestStaticChecker(unittest.TestCase):
     """Test cases for Static Analysis module"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.checker = StaticChecker()
-        self.test_dir = Path(__file__).parent / "static_analysis" / "examples"
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by all tests"""
+        # Cached results could hide a regression behind an earlier run
+        cls.checker = StaticChecker(use_cache=False)
+        cls.test_dir = examples_dir()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Release the shared checker"""
+        cls.checker.close()
     
     def test_initialization(self):
         """Test StaticChecker initialization"""
         self.assertIsInstance(self.checker, StaticChecker)
-        self.assertEqual(self.checker.results, [])
+        self.assertFalse(self.checker.use_cache)
+        self.assertTrue(self.checker.keep_details)
+        self.assertEqual(self.checker.results.maxlen, 16)
     
     def test_analyze_terraform_files_existing_directory(self):
         """Test analyzing an existing directory with Terraform files"""
@@ -41,6 +171,8 @@ class TestStaticChecker(unittest.TestCase):
             self.assertIn('analysis_timestamp', results)
             self.assertIn('results', results)
             self.assertIn('summary', results)
+            # Reports share one UTC timestamp format
+            self.assertTrue(results['analysis_timestamp'].endswith('+00:00'))
             
             # Check results structure
             results_data = results['results']
@@ -65,8 +197,24 @@ class TestStaticChecker(unittest.TestCase):
             self.assertIn('error_message', results)
             self.assertIn('No Terraform files found', results['error_message'])
     
+    def test_extract_checkov_checks_skips_non_json_output(self):
+        """Test that blank or log-only Checkov output counts as no checks without a parse"""
+        for stdout in (None, "", b"", "\n  \n", b"2024-01-01 INFO scanning\n"):
+            with self.subTest(stdout=stdout):
+                self.assertEqual(static_checker._extract_checkov_checks(stdout), ([], []))
+        
+        failed, passed = static_checker._extract_checkov_checks(
+            b'\n{"results": {"failed_checks": [{"check_id": "CKV_1"}], "passed_checks": []}}'
+        )
+        self.assertEqual(([check['check_id'] for check in failed], passed), (["CKV_1"], []))
+        
+        # Output that starts like JSON but is not still reports a parse error
+        with self.assertRaises(json.JSONDecodeError):
+            static_checker._extract_checkov_checks('{"results": ')
+    
     def test_get_results_summary_no_results(self):
         """Test getting summary when no results exist"""
+        self.checker.results.clear()
         summary = self.checker.get_results_summary()
         
         self.assertIn('message', summary)
@@ -85,14 +233,446 @@ class TestStaticChecker(unittest.TestCase):
             self.assertIn('latest_analysis', summary)
             self.assertGreater(summary['total_analyses'], 0)
 
+@unittest.skipIf(os.name == 'nt', "fake tools are POSIX scripts")
+class FakeToolsTestCase(unittest.TestCase):
+    """Base for tests that run against fake tools on PATH"""
+    
+    fake_tools = FAKE_TOOLS
+    
+    def setUp(self):
+        """Put the fake tools first on PATH and give each test its own caches"""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_path = Path(temp_dir.name)
+        
+        bin_dir = self.temp_path / "bin"
+        bin_dir.mkdir()
+        for name, script in self.fake_tools.items():
+            tool_path = bin_dir / name
+            tool_path.write_text(script)
+            tool_path.chmod(0o755)
+        self.log_file = self.temp_path / "calls.log"
+        self.log_file.touch()
+        
+        env = mock.patch.dict(os.environ, {
+            "PATH": f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+            "IAC_FAKE_LOG": str(self.log_file),
+            "XDG_CACHE_HOME": str(self.temp_path / "cache"),
+            "TF_PLUGIN_CACHE_DIR": str(self.temp_path / "plugins")
+        })
+        env.start()
+        self.addCleanup(env.stop)
+    
+    def tool_calls(self, tool: str, subcommand: str = None) -> int:
+        """Count runs of a fake tool, or of one of its subcommands, not counting version probes"""
+        return sum(
+            1 for line in self.log_file.read_text().splitlines()
+            if line.split()[0] == tool and 'version' not in line and
+            (subcommand is None or line.split()[1:2] == [subcommand])
+        )
+
+class TestStaticCheckerFakeTools(FakeToolsTestCase):
+    """Test cases for Static Analysis against fake tools on PATH"""
+    
+    def setUp(self):
+        """Add a Terraform directory and forget tool versions probed by other tests"""
+        super().setUp()
+        # Tool versions are probed once per process
+        static_checker._tool_version.cache_clear()
+        self.addCleanup(static_checker._tool_version.cache_clear)
+        
+        self.terraform_dir = self.temp_path / "terraform"
+        self.terraform_dir.mkdir()
+        (self.terraform_dir / "main.tf").write_text('resource "aws_s3_bucket" "logs" {}\n')
+    
+    def test_validate_retried_after_init_when_modules_missing(self):
+        """Test that a skipped init runs after all when validate asks for it"""
+        (self.terraform_dir / ".terraform" / "providers").mkdir(parents=True)
+        (self.terraform_dir / ".terraform.lock.hcl").touch()
+        # Older than the lock file, so init is skipped up front
+        os.utime(self.terraform_dir / "main.tf", ns=(0, 0))
+        
+        with mock.patch.dict(os.environ, {"IAC_FAKE_VALIDATE": "needs_init"}):
+            result = StaticChecker(use_cache=False)._run_terraform_validate(str(self.terraform_dir))
+        
+        self.assertEqual(result['status'], 'success')
+        self.assertTrue(result['valid'])
+        self.assertEqual(self.tool_calls("terraform", "init"), 1)
+        self.assertEqual(self.tool_calls("terraform", "validate"), 2)
+    
+    def test_init_sentinel_skips_repeat_init(self):
+        """Test that a successful init is recorded and only repeated after sources change"""
+        checker = StaticChecker(use_cache=False)
+        checker._run_terraform_validate(str(self.terraform_dir))
+        self.assertTrue((self.terraform_dir / static_checker._INIT_SENTINEL).is_file())
+        
+        checker._run_terraform_validate(str(self.terraform_dir))
+        self.assertEqual(self.tool_calls("terraform", "init"), 1)
+        
+        # A source newer than the sentinel needs a fresh init
+        future = time.time_ns() + 60 * 10**9
+        os.utime(self.terraform_dir / "main.tf", ns=(future, future))
+        checker._run_terraform_validate(str(self.terraform_dir))
+        self.assertEqual(self.tool_calls("terraform", "init"), 2)
+        self.assertEqual(self.tool_calls("terraform", "validate"), 3)
+        self.assertIn("-input=false", self.log_file.read_text())
+    
+    def test_invalid_configuration_cancels_linters(self):
+        """Test that TFLint and Checkov are stopped once validate reports errors"""
+        started = time.monotonic()
+        with mock.patch.dict(os.environ, {"IAC_FAKE_VALIDATE": "invalid", "IAC_FAKE_SLEEP": "10"}):
+            results = StaticChecker(use_cache=False).analyze_terraform_files(str(self.terraform_dir))
+        
+        self.assertLess(time.monotonic() - started, 8)
+        self.assertEqual(results['results']['tflint']['status'], 'not_run')
+        self.assertEqual(results['results']['checkov']['status'], 'not_run')
+        self.assertEqual(results['results']['terraform_validate']['error_count'], 1)
+        self.assertEqual(results['summary']['overall_status'], 'TOOL_ERROR')
+    
+    def test_validate_failure_without_diagnostics_keeps_linters(self):
+        """Test that a validate run that failed to run does not cancel the other tools"""
+        with mock.patch.dict(os.environ, {"IAC_FAKE_VALIDATE": "broken"}):
+            results = StaticChecker(use_cache=False).analyze_terraform_files(str(self.terraform_dir))
+        
+        self.assertEqual(results['results']['terraform_validate']['status'], 'error')
+        self.assertEqual(results['results']['tflint']['status'], 'success')
+        self.assertEqual(results['results']['checkov']['failed_checks'], 3)
+    
+    @unittest.skipIf(static_checker.ijson is None, "ijson is not installed")
+    def test_checkov_streaming_counts_and_raw_file(self):
+        """Test that streamed Checkov output is counted and copied to the raw findings file"""
+        checker = StaticChecker(keep_details=False)
+        self.addCleanup(checker.close)
+        result = checker.run_checkov(str(self.terraform_dir))
+        
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual((result['failed_checks'], result['passed_checks']), (3, 1))
+        self.assertEqual(result['summary'], {"critical": 0, "high": 1, "medium": 1, "low": 1})
+        self.assertEqual(result['results'], {"failed": [], "passed": []})
+        raw_report = json.loads(Path(result['raw_results_file']).read_text())
+        self.assertEqual([check['check_id'] for check in raw_report['results']['failed_checks']],
+                         ["CKV_1", "CKV_2", "CKV_3"])
+    
+    @unittest.skipIf(static_checker.ijson is None, "ijson is not installed")
+    def test_checkov_streaming_kills_checkov_after_stdout_closes(self):
+        """Test that a Checkov that closes stdout but never exits still times out"""
+        checker = StaticChecker(keep_details=False)
+        self.addCleanup(checker.close)
+        with mock.patch.object(static_checker, '_CHECKOV_TIMEOUT', 1), \
+                mock.patch.dict(os.environ, {"IAC_FAKE_CHECKOV_LINGER": "1"}):
+            started = time.monotonic()
+            result = checker.run_checkov(str(self.terraform_dir))
+        
+        self.assertEqual(result['status'], 'timeout')
+        self.assertLess(time.monotonic() - started, 15)
+    
+    def test_checkov_log_prefix_skipped(self):
+        """Test that log lines before Checkov's report are skipped on the in-memory and streaming paths"""
+        keep_details_options = [True]
+        if static_checker.ijson is not None:
+            keep_details_options.append(False)
+        for keep_details in keep_details_options:
+            checker = StaticChecker(keep_details=keep_details)
+            self.addCleanup(checker.close)
+            with self.subTest(keep_details=keep_details):
+                with mock.patch.dict(os.environ, {"IAC_FAKE_CHECKOV_LOGS": "1"}):
+                    result = checker.run_checkov(str(self.terraform_dir))
+                self.assertEqual(result['status'], 'success')
+                self.assertEqual((result['failed_checks'], result['passed_checks']), (3, 1))
+                self.assertEqual(result['summary'], {"critical": 0, "high": 1, "medium": 1, "low": 1})
+                
+                # Log lines without any report count as an empty report
+                with mock.patch.dict(os.environ, {"IAC_FAKE_CHECKOV_LOGS": "only"}):
+                    result = checker.run_checkov(str(self.terraform_dir))
+                self.assertEqual(result['status'], 'success')
+                self.assertEqual(result['total_checks'], 0)
+    
+    def test_history_is_bounded_and_drops_details(self):
+        """Test that the analysis history keeps counts but no per-finding lists"""
+        checker = StaticChecker(use_cache=False, history=2)
+        for _ in range(3):
+            results = checker.analyze_terraform_files(str(self.terraform_dir))
+        
+        # The caller still gets the findings
+        self.assertEqual(len(results['results']['checkov']['results']['failed']), 3)
+        self.assertEqual(len(checker.results), 2)
+        self.assertEqual(checker.get_results_summary()['total_analyses'], 3)
+        for history_entry in checker.results:
+            self.assertEqual(history_entry['results']['checkov']['failed_checks'], 3)
+            for tool_result in history_entry['results'].values():
+                self.assertFalse({'diagnostics', 'issues', 'results'} & set(tool_result))
+    
+    def test_raw_findings_loaded_on_demand_and_evicted(self):
+        """Test get_raw_findings without details and cleanup of evicted raw files"""
+        checker = StaticChecker(use_cache=False, keep_details=False, history=1)
+        first = checker.analyze_terraform_files(str(self.terraform_dir))
+        first_raw_file = first['results']['checkov']['raw_results_file']
+        self.assertEqual(first['results']['checkov']['results'], {"failed": [], "passed": []})
+        
+        findings = checker.get_raw_findings()
+        self.assertEqual([check['check_id'] for check in findings['failed']], ["CKV_1", "CKV_2", "CKV_3"])
+        self.assertEqual(len(findings['passed']), 1)
+        
+        # The first analysis drops out of the history, and its raw file with it
+        second = checker.analyze_terraform_files(str(self.terraform_dir))
+        self.assertFalse(os.path.exists(first_raw_file))
+        self.assertIsNone(checker.get_raw_findings(-2))
+        
+        second_raw_file = second['results']['checkov']['raw_results_file']
+        checker.close()
+        self.assertFalse(os.path.exists(second_raw_file))
+        self.assertIsNone(checker.get_raw_findings())
+    
+    def test_checkov_worker_reports_checkov_errors(self):
+        """Test that a Checkov run raising inside the worker is an error, not a pass"""
+        package_dir = self.temp_path / "python" / "checkov"
+        package_dir.mkdir(parents=True)
+        (package_dir / "__init__.py").touch()
+        (package_dir / "main.py").write_text(
+            "class Checkov:\n"
+            "    def __init__(self, argv):\n"
+            "        self.directory = argv[argv.index('--directory') + 1]\n"
+            "    def run(self):\n"
+            "        if self.directory.endswith('broken'):\n"
+            "            raise ValueError('registry exploded')\n"
+            "        print('{\"results\": {\"failed_checks\": [], \"passed_checks\": [{}]}}')\n"
+        )
+        broken_dir = self.temp_path / "broken"
+        broken_dir.mkdir()
+        
+        with mock.patch.dict(os.environ, {"PYTHONPATH": str(package_dir.parent)}):
+            with StaticChecker() as checker:
+                broken = checker.run_checkov(str(broken_dir))
+                passing = checker.run_checkov(str(self.terraform_dir))
+        
+        self.assertEqual(broken['status'], 'error')
+        self.assertIn('registry exploded', broken['error_message'])
+        self.assertEqual(passing['status'], 'success')
+        self.assertEqual(passing['passed_checks'], 1)
+        # Both runs went through the worker, not the fake checkov command
+        self.assertEqual(self.tool_calls("checkov"), 0)
+    
+    def test_cache_miss_when_analysis_input_changes(self):
+        """Test that changing any tool input, not only .tf files, re-runs the tools"""
+        module_dir = self.temp_path / "module"
+        module_dir.mkdir()
+        (module_dir / "main.tf").write_text('variable "name" {}\n')
+        (self.terraform_dir / "module.tf").write_text('module "m" {\n  source = "../module"\n}\n')
+        
+        StaticChecker().analyze_terraform_files(str(self.terraform_dir))
+        StaticChecker().analyze_terraform_files(str(self.terraform_dir))
+        self.assertEqual(self.tool_calls("tflint"), 1)
+        
+        changes = [
+            (self.terraform_dir / ".tflint.hcl", 'plugin "aws" {\n  enabled = true\n}\n'),
+            (self.terraform_dir / ".checkov.yaml", 'skip-check:\n  - CKV_1\n'),
+            (self.terraform_dir / "terraform.tfvars", 'name = "logs"\n'),
+            (module_dir / "main.tf", 'variable "name" {\n  type = string\n}\n')
+        ]
+        for expected_runs, (input_file, content) in enumerate(changes, start=2):
+            with self.subTest(input_file=input_file.name):
+                input_file.write_text(content)
+                results = StaticChecker().analyze_terraform_files(str(self.terraform_dir))
+                self.assertEqual(self.tool_calls("tflint"), expected_runs)
+                self.assertEqual(self.tool_calls("checkov"), expected_runs)
+                self.assertEqual(results['results']['tflint']['status'], 'success')
+
+class TestRunnerOutput(FakeToolsTestCase):
+    """Test cases for the test runner output options against fake tools"""
+    
+    def setUp(self):
+        """Add a Terraform directory and silence progress messages"""
+        super().setUp()
+        static_checker._tool_version.cache_clear()
+        self.addCleanup(static_checker._tool_version.cache_clear)
+        quiet = mock.patch.object(test_runner, '_quiet', True)
+        quiet.start()
+        self.addCleanup(quiet.stop)
+        
+        self.terraform_dir = self.temp_path / "terraform"
+        self.terraform_dir.mkdir()
+        (self.terraform_dir / "main.tf").write_text('resource "aws_instance" "web" {}\n')
+    
+    def run_cli(self, *args: str):
+        """Run test_runner.py as a script and return the completed process"""
+        return subprocess.run(
+            [sys.executable, str(Path(__file__).parent / "test_runner.py"), *args],
+            capture_output=True, timeout=60
+        )
+    
+    def test_compact_json_to_stdout(self):
+        """Test that -o - --compact leaves only the compact report on stdout"""
+        completed = self.run_cli('static', str(self.terraform_dir), '-o', '-', '--compact', '--no-cache')
+        
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        self.assertEqual(len(completed.stdout.splitlines()), 1)
+        report = json.loads(completed.stdout)
+        self.assertEqual(report['summary']['security_issues'], 3)
+        # Progress messages and the summary move to stderr
+        self.assertIn(b'ANALYSIS SUMMARY', completed.stderr)
+    
+    def test_profile_includes_worker_threads(self):
+        """Test that --profile saves stats covering the tool threads too"""
+        profile_file = self.temp_path / "run.prof"
+        results_file = self.temp_path / "results.json"
+        completed = self.run_cli('-q', '--profile', str(profile_file),
+                                 'static', str(self.terraform_dir), '-o', str(results_file), '--no-cache')
+        
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        self.assertTrue(results_file.is_file())
+        profiled_functions = {function[2] for function in pstats.Stats(str(profile_file)).stats}
+        self.assertIn('analyze_terraform_files', profiled_functions)
+        # Run in the tool thread pool, so only seen when each thread is profiled
+        self.assertIn('_run_terraform_validate', profiled_functions)
+    
+    def test_compressed_output_by_suffix(self):
+        """Test that .gz and .zst output files are compressed versions of the JSON report"""
+        readers = {".gz": gzip.decompress}
+        if zstandard is not None:
+            readers[".zst"] = lambda data: zstandard.ZstdDecompressor().stream_reader(data).read()
+        
+        for suffix, decompress in readers.items():
+            with self.subTest(suffix=suffix):
+                output_file = self.temp_path / f"results.json{suffix}"
+                results = test_runner.run_static_analysis(str(self.terraform_dir), str(output_file),
+                                                          use_cache=False)
+                report = json.loads(decompress(output_file.read_bytes()))
+                self.assertEqual(report['summary'], results['summary'])
+                self.assertEqual(list(self.temp_path.glob("*.tmp")), [])
+    
+    def test_combined_report_matches_output(self):
+        """Test that the returned CombinedReport has the written report's fields and summary"""
+        output_file = self.temp_path / "combined.json"
+        report = test_runner.run_combined_analysis(str(self.terraform_dir), output_file=str(output_file),
+                                                   use_cache=False)
+        
+        self.assertIsInstance(report, test_runner.CombinedReport)
+        written = json.loads(output_file.read_text())
+        self.assertEqual(list(report.to_dict()), list(written))
+        self.assertEqual(report.summary, written['summary'])
+        self.assertEqual(report.summary['failed_checks'],
+                         report.static_analysis['summary']['total_issues']
+                         + report.policy_compliance['failed_policies'])
+    
+    def test_combined_ndjson_records(self):
+        """Test that the combined NDJSON report has one record per finding and policy"""
+        output_file = self.temp_path / "report.ndjson"
+        test_runner.run_combined_analysis(str(self.terraform_dir), output_file=str(output_file),
+                                          use_cache=False, output_format="ndjson")
+        
+        records = [json.loads(line) for line in output_file.read_text().splitlines()]
+        self.assertEqual(records[0]['type'], 'meta')
+        self.assertEqual(records[0]['analysis_type'], 'combined')
+        self.assertEqual((records[-1]['type'], records[-1]['section']), ('summary', 'combined'))
+        
+        checkov_findings = [record for record in records
+                            if record['type'] == 'static' and record['tool'] == 'checkov']
+        self.assertEqual([record['finding']['check_id'] for record in checkov_findings],
+                         ["CKV_1", "CKV_2", "CKV_3"])
+        section_summaries = [record['section'] for record in records if record['type'] == 'summary']
+        self.assertEqual(section_summaries, ['static_analysis', 'policy_compliance', 'combined'])
+        self.assertTrue(any(record['type'] == 'policy' for record in records))
+    
+class TestComplianceCheckerOpa(FakeToolsTestCase):
+    """Test cases for OPA checks against a fake OPA server"""
+    
+    fake_tools = {"opa": FAKE_OPA}
+    
+    def setUp(self):
+        """Write a policy file for the fake OPA server"""
+        super().setUp()
+        self.policy_file = self.temp_path / "policy.rego"
+        self.policy_file.write_text("package terraform\n")
+        policies_dir = Path(__file__).parent / "policy_compliance" / "policies"
+        self.checker = ComplianceChecker(str(policies_dir), cache_policies=False)
+        self.addCleanup(self.checker.close)
+    
+    def write_input(self, name: str, document: dict) -> str:
+        """Write an OPA input document and return its path"""
+        input_file = self.temp_path / name
+        input_file.write_text(json.dumps(document))
+        return str(input_file)
+    
+    def test_run_opa_check_matches_opa_eval_output(self):
+        """Test that the server results keep the shape of opa eval output"""
+        result = self.checker.run_opa_check(self.write_input("plan.json", {"name": "web"}),
+                                            str(self.policy_file))
+        
+        self.assertEqual(result['status'], 'success')
+        expression = result['results']['result'][0]['expressions'][0]
+        self.assertEqual(expression['value'], ["deny web"])
+        self.assertEqual(expression['text'], "data.terraform.deny")
+        self.assertEqual(result['violations'], result['results']['result'])
+        
+        # An undefined deny rule prints {} from opa eval
+        result = self.checker.run_opa_check(self.write_input("empty.json", {}), str(self.policy_file))
+        self.assertEqual(result['results'], {})
+        self.assertEqual(result['violations'], [])
+    
+    def test_run_opa_check_batch_reuses_server(self):
+        """Test that a batch is evaluated by a single OPA server"""
+        inputs = [self.write_input(f"plan{index}.json", {"name": f"r{index}"}) for index in range(3)]
+        results = self.checker.run_opa_check_batch(inputs, str(self.policy_file))
+        
+        self.assertEqual([results[path]['status'] for path in inputs], ['success'] * 3)
+        self.assertEqual(self.tool_calls("opa"), 1)
+        self.assertEqual(self.tool_calls("opa-query"), 3)
+    
+    def test_opa_server_start_retried(self):
+        """Test that a server exiting during startup is started again"""
+        with mock.patch.dict(os.environ, {"IAC_FAKE_OPA_FAIL_ONCE": str(self.temp_path / "failed")}):
+            result = self.checker.run_opa_check(self.write_input("plan.json", {"name": "web"}),
+                                                str(self.policy_file))
+        
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual(self.tool_calls("opa"), 2)
+    
+    def test_opa_compile_error_reported_without_retry(self):
+        """Test that a policy that fails to compile reports OPA's error and is started once"""
+        self.policy_file.write_text("deny[msg] {\n")
+        result = self.checker.run_opa_check(self.write_input("plan.json", {"name": "web"}),
+                                            str(self.policy_file))
+        
+        self.assertEqual(result['status'], 'error')
+        self.assertIn("rego_parse_error", result['error_message'])
+        self.assertEqual(self.tool_calls("opa"), 1)
+    
+    def test_edited_policy_restarts_server(self):
+        """Test that changing the policy file starts a new OPA server for it"""
+        input_file = self.write_input("plan.json", {"name": "web"})
+        self.checker.run_opa_check(input_file, str(self.policy_file))
+        self.checker.run_opa_check(input_file, str(self.policy_file))
+        self.assertEqual(self.tool_calls("opa"), 1)
+        
+        self.policy_file.write_text("package terraform\n\ndeny[msg] { msg := \"edited\" }\n")
+        stat = self.policy_file.stat()
+        os.utime(self.policy_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        result = self.checker.run_opa_check(input_file, str(self.policy_file))
+        
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual(self.tool_calls("opa"), 2)
+    
+    def test_run_opa_check_rejects_directory_input(self):
+        """Test that a directory is rejected like opa eval -i does, without starting OPA"""
+        result = self.checker.run_opa_check(str(self.temp_path), str(self.policy_file))
+        
+        self.assertEqual(result['status'], 'error')
+        self.assertEqual(self.tool_calls("opa"), 0)
+
 class TestComplianceChecker(unittest.TestCase):
     """Test cases for Policy Compliance module"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.policies_dir = Path(__file__).parent / "policy_compliance" / "policies"
-        self.checker = ComplianceChecker(str(self.policies_dir))
-        self.test_dir = Path(__file__).parent / "static_analysis" / "examples"
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by all tests"""
+        cls.policies_dir = Path(__file__).parent / "policy_compliance" / "policies"
+        cls.checker = ComplianceChecker(str(cls.policies_dir), cache_policies=False)
+        cls.test_dir = examples_dir()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Release the shared checker"""
+        cls.checker.close()
     
     def test_initialization(self):
         """Test ComplianceChecker initialization"""
@@ -150,12 +730,29 @@ class TestComplianceChecker(unittest.TestCase):
     
     def test_check_compliance_no_policies(self):
         """Test compliance checking with no policies loaded"""
-        empty_checker = ComplianceChecker("/nonexistent/policies")
+        empty_checker = ComplianceChecker("/nonexistent/policies", cache_policies=False)
         results = empty_checker.check_compliance(str(self.test_dir))
         
         self.assertEqual(results['status'], 'error')
         self.assertIn('No policies loaded', results['error_message'])
     
+    def test_policy_violations_in_resource_order(self):
+        """Test that violations are listed resource by resource, then by rule"""
+        policy = compile_policy("tagging", {
+            "resource_types": ["aws_instance", "aws_instance"],
+            "rules": [{"property": "tags", "required": True}, {"property": "ami", "required": True}]
+        })
+        resources = [{"type": "aws_instance", "name": name, "address": f"aws_instance.{name}"}
+                     for name in ("web", "db")]
+        
+        result = self.checker._check_policy_compliance(policy, {"aws_instance": resources})
+        
+        self.assertEqual(result['applicable_resources'], 2)
+        self.assertEqual([(violation['resource'], violation['rule'].split()[1])
+                          for violation in result['violations']],
+                         [("aws_instance.web", "tags"), ("aws_instance.web", "ami"),
+                          ("aws_instance.db", "tags"), ("aws_instance.db", "ami")])
+    
     def test_validate_resource_policies(self):
         """Test validating a single resource against policies"""
         if self.checker.policies:
@@ -173,15 +770,208 @@ class TestComplianceChecker(unittest.TestCase):
             for violation in violations:
                 self.assertIsInstance(violation, (str, dict))
 
+    def test_validate_resource_policies_with_body(self):
+        """Test that required properties are checked when the resource body is given"""
+        if 'tag_compliance' in self.checker.policies:
+            test_resource = {
+                'type': 'aws_instance',
+                'name': 'web',
+                'address': 'aws_instance.web',
+                'body': 'ami = "ami-123"\n  tags = {\n    Name = "web"\n  }\n'
+            }
+            violations = self.checker.validate_resource_policies(test_resource)
+            self.assertFalse(any(v['policy'] == 'tag_compliance' for v in violations))
+            
+            test_resource['body'] = 'ami = "ami-123"\n'
+            violations = self.checker.validate_resource_policies(test_resource)
+            self.assertTrue(any(v['policy'] == 'tag_compliance' for v in violations))
+    
+    def test_parse_terraform_files_keeps_compliance_file_set(self):
+        """Test that compliance reads .tf files only and prunes just .terraform and .git"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            terraform_dir = Path(temp_dir)
+            (terraform_dir / "main.tf").write_text('resource "aws_instance" "web" {}\n')
+            (terraform_dir / "stack.tf.json").write_text(json.dumps({
+                "resource": {"aws_s3_bucket": {"logs": {}}}
+            }))
+            for subdir, name in (("node_modules", "vendored"), (".terraform", "cached"), (".git", "tracked")):
+                (terraform_dir / subdir).mkdir()
+                (terraform_dir / subdir / "main.tf").write_text(f'resource "aws_vpc" "{name}" {{}}\n')
+            
+            resources = self.checker._parse_terraform_files(str(terraform_dir))
+            static_results = StaticChecker(use_cache=False).analyze_terraform_files(str(terraform_dir))
+        
+        self.assertEqual(sorted(resource['address'] for resource in resources),
+                         ["aws_instance.web", "aws_vpc.vendored"])
+        # Static analysis also reads .tf.json and prunes node_modules
+        self.assertEqual(static_results['terraform_files_found'], 2)
+    
+    def test_parse_cache_reuses_unchanged_files(self):
+        """Test that only changed .tf files are parsed again and the cache stays bounded"""
+        checker = ComplianceChecker(str(self.policies_dir), cache_policies=False)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tf_files = [Path(temp_dir) / f"{name}.tf" for name in ("a", "b", "c")]
+            for tf_file in tf_files:
+                tf_file.write_text(f'resource "aws_instance" "{tf_file.stem}" {{}}\n')
+            
+            with mock.patch.object(checker, '_parse_terraform_file',
+                                   wraps=checker._parse_terraform_file) as parse_file:
+                checker._parse_terraform_files(temp_dir)
+                checker._parse_terraform_files(temp_dir)
+                self.assertEqual(parse_file.call_count, 3)
+                
+                tf_files[0].write_text('resource "aws_instance" "renamed" {}\n')
+                os.utime(tf_files[0], ns=(0, 0))
+                resources = checker._parse_terraform_files(temp_dir)
+                self.assertEqual(parse_file.call_count, 4)
+            self.assertIn("aws_instance.renamed", [resource['address'] for resource in resources])
+            
+            with mock.patch('policy_compliance.compliance_checker._PARSE_CACHE_SIZE', 2):
+                checker._parse_cache.clear()
+                checker._parse_terraform_files(temp_dir)
+                self.assertEqual(len(checker._parse_cache), 2)
+    
+    def test_parse_cache_unaffected_by_caller_changes(self):
+        """Test that changing returned resources does not change what a later parse returns"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / "main.tf").write_text('resource "aws_instance" "web" {}\n')
+            
+            resources = self.checker._parse_terraform_files(temp_dir)
+            resources[0]['address'] = "changed"
+            reparsed = self.checker._parse_terraform_files(temp_dir)
+        
+        self.assertEqual([resource['address'] for resource in reparsed], ["aws_instance.web"])
+    
+    def test_policies_cache_invalidated_on_change(self):
+        """Test that cached policies are reloaded when a policy file changes"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            policies_dir = Path(temp_dir) / "policies"
+            policies_dir.mkdir()
+            policy_file = policies_dir / "policy.json"
+            policy_file.write_text(json.dumps({"policies": [{"name": "first"}]}))
+            
+            with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": str(Path(temp_dir) / "cache")}):
+                self.assertEqual(list(ComplianceChecker(str(policies_dir)).policies), ["first"])
+                # Served from cache while the file is unchanged
+                self.assertEqual(list(ComplianceChecker(str(policies_dir)).policies), ["first"])
+                
+                policy_file.write_text(json.dumps({"policies": [{"name": "second"}]}))
+                os.utime(policy_file, ns=(0, 0))
+                self.assertEqual(list(ComplianceChecker(str(policies_dir)).policies), ["second"])
+
+class TestSimpleResourceReporter(unittest.TestCase):
+    """Test cases for the simple resource reporter"""
+    
+    def setUp(self):
+        """Write a small Terraform tree to report on"""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.terraform_dir = Path(temp_dir.name)
+        # A non-UTF-8 comment byte is fine, since only the captured names are decoded
+        (self.terraform_dir / "main.tf").write_bytes(
+            b'# caf\xe9\nresource "aws_s3_bucket" "logs" {}\nresource "aws_instance" "web" {}\n'
+        )
+        (self.terraform_dir / "network").mkdir()
+        (self.terraform_dir / "network" / "network.tf").write_text(
+            'resource "aws_vpc" "main" {}\nresource "aws_s3_bucket" "assets" {}\n'
+        )
+        (self.terraform_dir / ".terraform").mkdir()
+        (self.terraform_dir / ".terraform" / "vendored.tf").write_text('resource "aws_vpc" "cached" {}\n')
+    
+    def analyze(self, verbose: bool = False):
+        """Run the reporter on the tree and return its report and printed output"""
+        output = io.StringIO()
+        with mock.patch('sys.stdout', output):
+            report = SimpleResourceReporter(verbose=verbose).analyze_terraform_directory(
+                str(self.terraform_dir))
+        return report, output.getvalue()
+    
+    def test_report_counts_and_breakdown(self):
+        """Test resource counts, the per-type breakdown and the shared scan timestamp"""
+        report, _ = self.analyze()
+        
+        metadata = report['report_metadata']
+        self.assertEqual(metadata['total_resources'], 4)
+        self.assertEqual(metadata['configuration_size'], "Small (≤5 resources)")
+        self.assertEqual(report['resource_breakdown']['aws_s3_bucket'],
+                         {"count": 2, "average_time": 6.2, "total_time": 12.4})
+        self.assertEqual(report['resource_breakdown']['aws_vpc']['count'], 1)
+        self.assertEqual(sum(entry['count'] for entry in report['resource_breakdown'].values()), 4)
+        
+        detailed = report['detailed_resources']
+        # Files are read concurrently, but each file's resources keep their order
+        self.assertEqual([(resource['file'], resource['resource_name']) for resource in detailed
+                          if resource['file'] == "main.tf"],
+                         [("main.tf", "logs"), ("main.tf", "web")])
+        self.assertNotIn("cached", [resource['resource_name'] for resource in detailed])
+        self.assertEqual(len({resource['timestamp'] for resource in detailed}), 1)
+        self.assertEqual(report['performance_summary']['resources'], 4)
+    
+    def test_verbose_prints_each_file(self):
+        """Test that per-file progress is printed only in verbose mode"""
+        _, quiet_output = self.analyze()
+        _, verbose_output = self.analyze(verbose=True)
+        
+        self.assertNotIn("Analyzing: main.tf", quiet_output)
+        self.assertIn("Analyzing: main.tf", verbose_output)
+        self.assertIn("Analyzing: network.tf", verbose_output)
+    
+    def test_save_report_round_trip(self):
+        """Test that a saved report reads back as the same report, with and without orjson"""
+        report, _ = self.analyze()
+        output_file = self.terraform_dir / "report.json"
+        
+        serializers = {"json": None}
+        if orjson is not None:
+            serializers["orjson"] = orjson
+        for serializer, module in serializers.items():
+            with self.subTest(serializer=serializer):
+                with mock.patch('simple_resource_reporter.orjson', module), \
+                        mock.patch('sys.stdout', io.StringIO()):
+                    SimpleResourceReporter().save_report(report, str(output_file))
+                
+                self.assertEqual(json.loads(output_file.read_text(encoding='utf-8')), report)
+    
+    def test_main_verbose_flag(self):
+        """Test the command line with and without --verbose/-v"""
+        script = Path(__file__).parent / "simple_resource_reporter.py"
+        with tempfile.TemporaryDirectory() as work_dir:
+            outputs = {}
+            for flags in ((), ("-v",), ("--verbose",)):
+                completed = subprocess.run(
+                    [sys.executable, str(script), str(self.terraform_dir), *flags],
+                    cwd=work_dir, capture_output=True, text=True, encoding='utf-8'
+                )
+                self.assertEqual(completed.returncode, 0, completed.stderr)
+                outputs[flags] = completed.stdout
+            saved_report = json.loads((Path(work_dir) / "resource_analysis_report.json").read_text(encoding='utf-8'))
+            
+            missing_dir = subprocess.run([sys.executable, str(script)], cwd=work_dir,
+                                         capture_output=True, text=True, encoding='utf-8')
+        
+        self.assertNotIn("Analyzing: main.tf", outputs[()])
+        self.assertIn("Analyzing: main.tf", outputs[("-v",)])
+        self.assertIn("Analyzing: main.tf", outputs[("--verbose",)])
+        self.assertIn("Resources: 4", outputs[()])
+        self.assertEqual(saved_report['report_metadata']['total_resources'], 4)
+        self.assertEqual(missing_dir.returncode, 1)
+
 class TestIntegration(unittest.TestCase):
     """Integration tests for the complete framework"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.test_dir = Path(__file__).parent / "static_analysis" / "examples"
-        self.policies_dir = Path(__file__).parent / "policy_compliance" / "policies"
-        self.static_checker = StaticChecker()
-        self.compliance_checker = ComplianceChecker(str(self.policies_dir))
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by all tests"""
+        cls.test_dir = examples_dir()
+        cls.policies_dir = Path(__file__).parent / "policy_compliance" / "policies"
+        cls.static_checker = StaticChecker(use_cache=False)
+        cls.compliance_checker = ComplianceChecker(str(cls.policies_dir), cache_policies=False)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Release the shared checkers"""
+        cls.static_checker.close()
+        cls.compliance_checker.close()
     
     def test_combined_analysis(self):
         """Test running both static analysis and policy compliance"""
@@ -218,6 +1008,26 @@ class TestIntegration(unittest.TestCase):
             self.assertIn('summary', combined_report)
             self.assertIn('overall_status', combined_report['summary'])
     
+    def test_checker_modules_import_from_other_directory(self):
+        """Test that the checker modules find framework_utils without the project root on the path"""
+        project_root = Path(__file__).parent
+        script = (
+            "import importlib.util, sys\n"
+            "for path in sys.argv[1:]:\n"
+            "    spec = importlib.util.spec_from_file_location('checker', path)\n"
+            "    spec.loader.exec_module(importlib.util.module_from_spec(spec))\n"
+        )
+        env = {name: value for name, value in os.environ.items() if name != "PYTHONPATH"}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            completed = subprocess.run(
+                [sys.executable, "-c", script,
+                 str(project_root / "static_analysis" / "static_checker.py"),
+                 str(project_root / "policy_compliance" / "compliance_checker.py")],
+                cwd=temp_dir, env=env, capture_output=True, text=True
+            )
+        
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+    
     def test_report_generation(self):
         """Test generating JSON reports"""
         if self.test_dir.exists():
@@ -240,6 +1050,21 @@ class TestIntegration(unittest.TestCase):
             # Test JSON deserialization
             parsed_report = json.loads(json_str)
             self.assertEqual(parsed_report['terraform_directory'], str(self.test_dir))
+    
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_report_generation_orjson(self):
+        """Test that reports serialized with orjson, as the runners write them, match json"""
+        if self.test_dir.exists():
+            report = {
+                "timestamp": "2025-07-17T10:30:00Z",
+                "terraform_directory": str(self.test_dir),
+                "static_analysis": self.static_checker.analyze_terraform_files(str(self.test_dir)),
+                "policy_compliance": self.compliance_checker.check_compliance(str(self.test_dir))
+            }
+            
+            json_data = orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            self.assertIsInstance(json_data, bytes)
+            self.assertEqual(json.loads(json_data), json.loads(json.dumps(report)))
 
 if __name__ == '__main__':
     # Run tests
@@ -5,131 +5,550 @@ This script provides a command-line interface to run the framework components
 """
 
 import argparse
+import importlib.util
+import os
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext, redirect_stdout
+from dataclasses import dataclass, fields
 from pathlib import Path
-from datetime import datetime
 
-# Add the project root to the Python path
-sys.path.insert(0, str(Path(__file__).parent))
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library serializer
+    orjson = None
 
-from static_analysis.static_checker import StaticChecker
-from policy_compliance.compliance_checker import ComplianceChecker
+# Add the project root to the Python path so the checker imports inside the
+# run_* functions resolve however this module was loaded
+_PROJECT_ROOT = str(Path(__file__).parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
-def run_static_analysis(terraform_dir: str, output_file: str = None):
+from framework_utils import utc_timestamp
+
+# Set by --quiet to silence progress messages
+_quiet = False
+
+def _log(message: str):
+    """Write a progress message to stderr, keeping stdout for results"""
+    if not _quiet:
+        sys.stderr.write(message + '\n')
+
+# Incremental encoders used when orjson is not installed
+_SECTION_ENCODER = json.JSONEncoder(indent=2)
+_COMPACT_ENCODER = json.JSONEncoder(separators=(',', ':'))
+
+def _iter_json_chunks(value, compact: bool = False):
+    """
+    Encode a value as JSON, using orjson when it is installed
+    
+    Args:
+        value: Value to serialize
+        compact: Leave out all whitespace instead of indenting
+        
+    Yields:
+        Chunks of UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS if compact else orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        yield orjson.dumps(value, option=option)
+    else:
+        encoder = _COMPACT_ENCODER if compact else _SECTION_ENCODER
+        for chunk in encoder.iterencode(value):
+            yield chunk.encode('utf-8')
+
+def _dump_record(record: dict) -> bytes:
+    """Encode one NDJSON record as a compact line"""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(record, separators=(',', ':')).encode('utf-8') + b'\n'
+
+def _compressed_writer(f, output_file: str):
+    """
+    Wrap a binary file in a compressor chosen by the output file suffix
+    
+    Args:
+        f: Binary file object
+        output_file: Output file name; .zst uses zstd and .gz uses gzip
+        
+    Returns:
+        Writable binary stream
+    """
+    if output_file.endswith('.zst'):
+        import zstandard
+        return zstandard.ZstdCompressor(level=3).stream_writer(f)
+    if output_file.endswith('.gz'):
+        import gzip
+        return gzip.GzipFile(fileobj=f, mode='wb', compresslevel=6)
+    return f
+
+@contextmanager
+def _atomic_output(output_file: str):
+    """
+    Open a sibling temp file for writing and move it over output_file once complete
+    
+    Output files ending in .zst or .gz are compressed on the way out.
+    
+    Args:
+        output_file: Output file, or '-' for standard output
+        
+    Yields:
+        Binary file object
+    """
+    if output_file == '-':
+        # sys.__stdout__ stays the real stdout while progress output is redirected
+        stdout = sys.__stdout__.buffer
+        yield stdout
+        stdout.flush()
+        return
+    
+    tmp_file = f"{output_file}.{os.getpid()}.tmp"
+    raw = open(tmp_file, 'wb')
+    f = _compressed_writer(raw, output_file)
+    try:
+        yield f
+        # Closing the compressor flushes its trailer before the file is closed
+        f.close()
+        raw.close()
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        f.close()
+        raw.close()
+        os.remove(tmp_file)
+        raise
+
+def _write_json(output_file: str, results: dict, compact: bool = False):
+    """Write results to output_file as indented or compact JSON"""
+    with _atomic_output(output_file) as f:
+        for chunk in _iter_json_chunks(results, compact):
+            f.write(chunk)
+
+@contextmanager
+def _json_object_writer(output_file: str = None, compact: bool = False):
+    """
+    Write a JSON object to output_file one top-level field at a time
+    
+    Each field is encoded and written as soon as it is passed in, so a
+    finished section is on disk while later ones are still being computed.
+    The object is written to a sibling file and moved into place only once
+    it is complete.
+    
+    Args:
+        output_file: Output file, '-' for standard output, or None to discard the fields
+        compact: Leave out all whitespace instead of indenting
+        
+    Yields:
+        Function taking a field name and value
+    """
+    if not output_file:
+        yield lambda key, value: None
+        return
+    
+    if compact:
+        first_separator, separator, key_separator, end = b'{', b',', b':', b'}'
+    else:
+        first_separator, separator, key_separator, end = b'{\n  ', b',\n  ', b': ', b'\n}'
+    
+    with _atomic_output(output_file) as f:
+        field_count = 0
+        
+        def write_field(key, value):
+            nonlocal field_count
+            f.write(separator if field_count else first_separator)
+            f.write(json.dumps(key).encode('utf-8') + key_separator)
+            for chunk in _iter_json_chunks(value, compact):
+                # JSON strings never contain a raw newline, so this only re-indents structure
+                f.write(chunk if compact else chunk.replace(b'\n', b'\n  '))
+            field_count += 1
+        
+        yield write_field
+        f.write(end if field_count else b'{}')
+
+def _iter_static_records(static_results: dict):
+    """
+    Split static analysis results into one NDJSON record per finding
+    
+    Args:
+        static_results: Results of StaticChecker.analyze_terraform_files
+        
+    Yields:
+        Finding records followed by a summary record
+    """
+    tool_results = static_results.get('results') or {}
+    validate_result = tool_results.get('terraform_validate') or {}
+    tflint_result = tool_results.get('tflint') or {}
+    checkov_result = tool_results.get('checkov') or {}
+    checkov_checks = checkov_result.get('results') or {}
+    
+    for tool, findings in (
+        ('terraform_validate', validate_result.get('diagnostics') or []),
+        ('tflint', tflint_result.get('issues') or []),
+        ('checkov', checkov_checks.get('failed') or [])
+    ):
+        for finding in findings:
+            yield {"type": "static", "tool": tool, "finding": finding}
+    
+    summary = {"type": "summary", "section": "static_analysis", "status": static_results.get('status')}
+    if 'error_message' in static_results:
+        summary["error_message"] = static_results['error_message']
+    summary.update(static_results.get('summary') or {})
+    yield summary
+
+def _iter_policy_records(compliance_results: dict):
+    """
+    Split policy compliance results into one NDJSON record per policy
+    
+    Args:
+        compliance_results: Results of ComplianceChecker.check_compliance
+        
+    Yields:
+        Policy records followed by a summary record
+    """
+    for policy_result in compliance_results.get('results') or []:
+        yield {"type": "policy", "result": policy_result}
+    
+    summary = {"type": "summary", "section": "policy_compliance", "status": compliance_results.get('status')}
+    if 'error_message' in compliance_results:
+        summary["error_message"] = compliance_results['error_message']
+    for key in ('total_policies', 'passed_policies', 'failed_policies'):
+        if key in compliance_results:
+            summary[key] = compliance_results[key]
+    summary.update(compliance_results.get('summary') or {})
+    yield summary
+
+# Report sections that are split into several NDJSON records
+_NDJSON_SECTIONS = {
+    "static_analysis": _iter_static_records,
+    "policy_compliance": _iter_policy_records
+}
+
+@contextmanager
+def _ndjson_writer(output_file: str = None, compact: bool = True):
+    """
+    Write a report to output_file as newline-delimited JSON records
+    
+    Takes the same fields as _json_object_writer. Envelope fields are
+    gathered into a leading meta record, each report section becomes one
+    record per finding or policy, and the combined summary is the last line.
+    Records are always compact.
+    
+    Args:
+        output_file: Output file, '-' for standard output, or None to discard the fields
+        compact: Accepted for parity with _json_object_writer
+        
+    Yields:
+        Function taking a field name and value
+    """
+    if not output_file:
+        yield lambda key, value: None
+        return
+    
+    with _atomic_output(output_file) as f:
+        meta = {"type": "meta"}
+        
+        def write_meta():
+            nonlocal meta
+            if meta is not None:
+                f.write(_dump_record(meta))
+                meta = None
+        
+        def write_field(key, value):
+            if key in _NDJSON_SECTIONS:
+                write_meta()
+                for record in _NDJSON_SECTIONS[key](value):
+                    f.write(_dump_record(record))
+            elif key == "summary":
+                write_meta()
+                f.write(_dump_record({"type": "summary", "section": "combined", **value}))
+            else:
+                meta[key] = value
+        
+        yield write_field
+        write_meta()
+
+# Writers for each --format choice
+_OUTPUT_WRITERS = {
+    "json": _json_object_writer,
+    "ndjson": _ndjson_writer
+}
+
+def _write_results(output_file: str, results: dict, output_format: str, section: str,
+                   compact: bool = False):
+    """
+    Write the results of a single analysis in the requested format
+    
+    Args:
+        output_file: Output file, or '-' for standard output
+        results: Analysis results
+        output_format: 'json' or 'ndjson'
+        section: Report section the results belong to
+        compact: Write JSON without whitespace
+    """
+    if output_format != "ndjson":
+        _write_json(output_file, results, compact)
+        return
+    
+    with _ndjson_writer(output_file) as write_field:
+        for key in ('analysis_timestamp', 'terraform_directory'):
+            if key in results:
+                write_field(key, results[key])
+        write_field("analysis_type", section)
+        write_field(section, results)
+
+@dataclass(frozen=True)
+class CombinedReport:
+    """
+    Combined static analysis and policy compliance report, in output field order
+    """
+    analysis_timestamp: str
+    terraform_directory: str
+    analysis_type: str
+    static_analysis: dict
+    policy_compliance: dict
+    summary: dict
+    
+    @classmethod
+    def from_sections(cls, analysis_timestamp: str, terraform_directory: str,
+                      static_analysis: dict, policy_compliance: dict) -> "CombinedReport":
+        """
+        Build a combined report and its summary from the two sub-reports
+        
+        Args:
+            analysis_timestamp: When the combined analysis started
+            terraform_directory: Directory that was analyzed
+            static_analysis: Static analysis results
+            policy_compliance: Policy compliance results
+            
+        Returns:
+            Combined report
+        """
+        # Read each count once for the combined summary
+        static_issues = (static_analysis.get('summary') or {}).get('total_issues', 0)
+        failed_policies = policy_compliance.get('failed_policies', 0)
+        summary = {
+            "total_checks": static_issues + policy_compliance.get('total_policies', 0),
+            "passed_checks": policy_compliance.get('passed_policies', 0),
+            "failed_checks": static_issues + failed_policies,
+            "overall_status": "NEEDS_ATTENTION" if static_issues > 0 or failed_policies > 0 else "PASSED"
+        }
+        return cls(
+            analysis_timestamp=analysis_timestamp,
+            terraform_directory=terraform_directory,
+            analysis_type="combined",
+            static_analysis=static_analysis,
+            policy_compliance=policy_compliance,
+            summary=summary
+        )
+    
+    def to_dict(self) -> dict:
+        """
+        Convert the report to the dictionary written by run_combined_analysis
+        
+        Unlike dataclasses.asdict the sub-reports are shared rather than deep-copied.
+        
+        Returns:
+            Report fields in output order
+        """
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+def run_static_analysis(terraform_dir: str, output_file: str = None, use_cache: bool = True,
+                        output_format: str = "json", compact: bool = False, workers: int = None):
     """Run static analysis on Terraform files"""
-    print("🔍 Running Static Analysis...")
+    _log("🔍 Running Static Analysis...")
     
-    checker = StaticChecker()
+    # Checkers are imported by the subcommands that use them, so --help and demo skip them
+    from static_analysis.static_checker import StaticChecker
+    checker = StaticChecker(use_cache=use_cache, workers=workers)
     results = checker.analyze_terraform_files(terraform_dir)
     
     if output_file:
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
-        print(f"✅ Results saved to: {output_file}")
+        _write_results(output_file, results, output_format, "static_analysis", compact)
+        _log(f"✅ Results saved to: {output_file}")
     
     return results
 
-def run_policy_compliance(terraform_dir: str, policies_dir: str = None, output_file: str = None):
+def run_policy_compliance(terraform_dir: str, policies_dir: str = None, output_file: str = None,
+                          use_cache: bool = True, output_format: str = "json", compact: bool = False,
+                          workers: int = None):
     """Run policy compliance checking"""
-    print("🔐 Running Policy Compliance Checks...")
+    _log("🔐 Running Policy Compliance Checks...")
     
     if not policies_dir:
         policies_dir = str(Path(__file__).parent / "policy_compliance" / "policies")
     
-    checker = ComplianceChecker(policies_dir)
+    from policy_compliance.compliance_checker import ComplianceChecker
+    checker = ComplianceChecker(policies_dir, cache_policies=use_cache, workers=workers)
     results = checker.check_compliance(terraform_dir)
     
     if output_file:
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
-        print(f"✅ Results saved to: {output_file}")
+        _write_results(output_file, results, output_format, "policy_compliance", compact)
+        _log(f"✅ Results saved to: {output_file}")
     
     return results
 
-def run_combined_analysis(terraform_dir: str, policies_dir: str = None, output_file: str = None):
+def run_combined_analysis(terraform_dir: str, policies_dir: str = None, output_file: str = None,
+                          use_cache: bool = True, output_format: str = "json", compact: bool = False,
+                          workers: int = None) -> CombinedReport:
     """Run both static analysis and policy compliance"""
-    print("🚀 Running Combined Analysis...")
-    
-    # Run static analysis
-    static_results = run_static_analysis(terraform_dir)
-    
-    # Run policy compliance
-    compliance_results = run_policy_compliance(terraform_dir, policies_dir)
-    
-    # Combine results
-    combined_results = {
-        "analysis_timestamp": datetime.now().isoformat(),
-        "terraform_directory": terraform_dir,
-        "analysis_type": "combined",
-        "static_analysis": static_results,
-        "policy_compliance": compliance_results,
-        "summary": {
-            "total_checks": (
-                static_results.get('summary', {}).get('total_issues', 0) + 
-                compliance_results.get('total_policies', 0)
-            ),
-            "passed_checks": compliance_results.get('passed_policies', 0),
-            "failed_checks": (
-                static_results.get('summary', {}).get('total_issues', 0) + 
-                compliance_results.get('failed_policies', 0)
-            ),
-            "overall_status": "NEEDS_ATTENTION" if (
-                static_results.get('summary', {}).get('total_issues', 0) > 0 or
-                compliance_results.get('failed_policies', 0) > 0
-            ) else "PASSED"
-        }
-    }
+    _log("🚀 Running Combined Analysis...")
+    
+    analysis_timestamp = utc_timestamp()
+    
+    # Static analysis mostly waits on external tools and compliance checks
+    # parse the files in Python, so run both at once. IAC_PARALLEL=0 runs
+    # them one after another like the static checker's own tools
+    parallel = os.environ.get("IAC_PARALLEL", "1") != "0"
+    
+    # Sections are written out in report order as soon as each one is ready
+    with _OUTPUT_WRITERS[output_format](output_file, compact) as write_field, \
+            ThreadPoolExecutor(max_workers=2 if parallel else 1) as executor:
+        write_field("analysis_timestamp", analysis_timestamp)
+        write_field("terraform_directory", terraform_dir)
+        write_field("analysis_type", "combined")
+        
+        static_future = executor.submit(
+            run_static_analysis, terraform_dir, use_cache=use_cache, workers=workers
+        )
+        compliance_future = executor.submit(
+            run_policy_compliance, terraform_dir, policies_dir, use_cache=use_cache, workers=workers
+        )
+        
+        # Run static analysis
+        static_results = static_future.result()
+        write_field("static_analysis", static_results)
+        
+        # Run policy compliance
+        compliance_results = compliance_future.result()
+        write_field("policy_compliance", compliance_results)
+        
+        report = CombinedReport.from_sections(analysis_timestamp, terraform_dir,
+                                              static_results, compliance_results)
+        write_field("summary", report.summary)
     
     if output_file:
-        with open(output_file, 'w') as f:
-            json.dump(combined_results, f, indent=2)
-        print(f"✅ Combined results saved to: {output_file}")
+        _log(f"✅ Combined results saved to: {output_file}")
     
-    return combined_results
+    return report
 
 def print_summary(results: dict):
     """Print a summary of the results"""
-    print("\n" + "=" * 60)
-    print("📊 ANALYSIS SUMMARY")
-    print("=" * 60)
+    # Built as one block so the summary goes out in a single write
+    rule = "=" * 60
+    lines = ["", rule, "📊 ANALYSIS SUMMARY", rule]
     
     if 'static_analysis' in results:
         # Combined results
         static = results['static_analysis']
+        static_summary = static.get('summary') or {}
         compliance = results['policy_compliance']
+        compliance_summary = compliance.get('summary') or {}
+        combined_summary = results.get('summary') or {}
+        validation = '✅ PASSED' if static_summary.get('validation_passed') else '❌ FAILED'
         
-        print(f"📁 Directory: {results.get('terraform_directory')}")
-        print(f"🕐 Timestamp: {results.get('analysis_timestamp')}")
-        print(f"📄 Analysis Type: {results.get('analysis_type')}")
-        
-        print(f"\n🔍 Static Analysis:")
-        print(f"   - Status: {static.get('status')}")
-        print(f"   - Total Issues: {static.get('summary', {}).get('total_issues', 0)}")
-        print(f"   - Validation: {'✅ PASSED' if static.get('summary', {}).get('validation_passed') else '❌ FAILED'}")
-        
-        print(f"\n🔐 Policy Compliance:")
-        print(f"   - Status: {compliance.get('status')}")
-        print(f"   - Total Policies: {compliance.get('total_policies')}")
-        print(f"   - Passed: {compliance.get('passed_policies')}")
-        print(f"   - Failed: {compliance.get('failed_policies')}")
-        print(f"   - Score: {compliance.get('summary', {}).get('compliance_score', 0):.1f}%")
-        
-        print(f"\n📈 Overall Status: {results.get('summary', {}).get('overall_status')}")
+        lines.append(f"""📁 Directory: {results.get('terraform_directory')}
+🕐 Timestamp: {results.get('analysis_timestamp')}
+📄 Analysis Type: {results.get('analysis_type')}
+
+🔍 Static Analysis:
+   - Status: {static.get('status')}
+   - Total Issues: {static_summary.get('total_issues', 0)}
+   - Validation: {validation}
+
+🔐 Policy Compliance:
+   - Status: {compliance.get('status')}
+   - Total Policies: {compliance.get('total_policies')}
+   - Passed: {compliance.get('passed_policies')}
+   - Failed: {compliance.get('failed_policies')}
+   - Score: {compliance_summary.get('compliance_score', 0):.1f}%
+
+📈 Overall Status: {combined_summary.get('overall_status')}""")
         
     else:
         # Single analysis results
-        print(f"📁 Directory: {results.get('terraform_directory')}")
-        print(f"📄 Status: {results.get('status')}")
+        lines.append(f"📁 Directory: {results.get('terraform_directory')}")
+        lines.append(f"📄 Status: {results.get('status')}")
         
-        if 'summary' in results:
-            summary = results['summary']
-            print(f"📊 Total Issues: {summary.get('total_issues', 0)}")
-            print(f"📈 Overall Status: {summary.get('overall_status')}")
+        summary = results.get('summary')
+        if summary is not None:
+            lines.append(f"📊 Total Issues: {summary.get('total_issues', 0)}")
+            lines.append(f"📈 Overall Status: {summary.get('overall_status')}")
+    
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
+
+@contextmanager
+def _profiled(profile_file: str = None):
+    """
+    Profile the enclosed code with cProfile and save the stats to profile_file
+    
+    Before Python 3.12 cProfile only sees the thread that enabled it, so each
+    thread started meanwhile (the analyses and their tools run in pools) gets
+    its own profiler and the stats are merged into one file.
+    
+    Args:
+        profile_file: File for the pstats dump, or None to run unprofiled
+    """
+    if not profile_file:
+        yield
+        return
+    
+    import cProfile
+    import pstats
+    import threading
+    
+    profilers = [cProfile.Profile()]
+    
+    def profile_thread(*_):
+        sys.setprofile(None)
+        profiler = cProfile.Profile()
+        profilers.append(profiler)
+        profiler.enable()
+    
+    if sys.version_info < (3, 12):
+        threading.setprofile(profile_thread)
+    profilers[0].enable()
+    try:
+        yield
+    finally:
+        profilers[0].disable()
+        threading.setprofile(None)
+        stats = pstats.Stats(profilers[0])
+        for profiler in profilers[1:]:
+            stats.add(profiler)
+        stats.dump_stats(profile_file)
+        _log(f"⏱️ Profile saved to: {profile_file} (view with snakeviz or python -m pstats)")
+
+def _static_command(args) -> dict:
+    """Run the static subcommand"""
+    return run_static_analysis(args.terraform_dir, args.output, use_cache=not args.no_cache,
+                               output_format=args.output_format, compact=args.compact,
+                               workers=args.workers)
+
+def _policy_command(args) -> dict:
+    """Run the policy subcommand"""
+    return run_policy_compliance(args.terraform_dir, args.policies, args.output,
+                                 use_cache=not args.no_cache, output_format=args.output_format,
+                                 compact=args.compact, workers=args.workers)
+
+def _combined_command(args) -> dict:
+    """Run the combined subcommand"""
+    report = run_combined_analysis(args.terraform_dir, args.policies, args.output,
+                                   use_cache=not args.no_cache, output_format=args.output_format,
+                                   compact=args.compact, workers=args.workers)
+    return report.to_dict()
+
+def _demo_command(args):
+    """Run the demo subcommand"""
+    # Import and run demo
+    from demo_phase2 import main as demo_main
+    demo_main()
 
 def main():
     """Main CLI function"""
     parser = argparse.ArgumentParser(description="IaC Testing Framework - Phase 2")
+    parser.add_argument('--quiet', '-q', action='store_true', help='Suppress progress messages and the summary')
+    parser.add_argument('--profile', metavar='PATH', help='Save cProfile stats of the run to PATH')
     
     # Add subcommands
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
@@ -137,44 +556,62 @@ def main():
     # Static analysis command
     static_parser = subparsers.add_parser('static', help='Run static analysis')
     static_parser.add_argument('terraform_dir', help='Directory containing Terraform files')
-    static_parser.add_argument('--output', '-o', help='Output file for results')
+    static_parser.add_argument('--output', '-o', help="Output file for results, or '-' for stdout")
+    static_parser.add_argument('--compact', action='store_true', help='Write JSON without indentation')
+    static_parser.add_argument('--workers', type=int, help='Maximum concurrent tools and file readers')
+    static_parser.add_argument('--no-cache', action='store_true', help='Ignore cached results and re-run every check')
+    static_parser.add_argument('--format', choices=['json', 'ndjson'], default='json', dest='output_format', help='Output file format')
+    static_parser.set_defaults(func=_static_command)
     
     # Policy compliance command
     policy_parser = subparsers.add_parser('policy', help='Check policy compliance')
     policy_parser.add_argument('terraform_dir', help='Directory containing Terraform files')
     policy_parser.add_argument('--policies', '-p', help='Directory containing policy files')
-    policy_parser.add_argument('--output', '-o', help='Output file for results')
+    policy_parser.add_argument('--output', '-o', help="Output file for results, or '-' for stdout")
+    policy_parser.add_argument('--compact', action='store_true', help='Write JSON without indentation')
+    policy_parser.add_argument('--workers', type=int, help='Maximum concurrent tools and file readers')
+    policy_parser.add_argument('--no-cache', action='store_true', help='Ignore cached results and re-run every check')
+    policy_parser.add_argument('--format', choices=['json', 'ndjson'], default='json', dest='output_format', help='Output file format')
+    policy_parser.set_defaults(func=_policy_command)
     
     # Combined analysis command
     combined_parser = subparsers.add_parser('combined', help='Run complete analysis')
     combined_parser.add_argument('terraform_dir', help='Directory containing Terraform files')
     combined_parser.add_argument('--policies', '-p', help='Directory containing policy files')
-    combined_parser.add_argument('--output', '-o', help='Output file for results')
+    combined_parser.add_argument('--output', '-o', help="Output file for results, or '-' for stdout")
+    combined_parser.add_argument('--compact', action='store_true', help='Write JSON without indentation')
+    combined_parser.add_argument('--workers', type=int, help='Maximum concurrent tools and file readers')
+    combined_parser.add_argument('--no-cache', action='store_true', help='Ignore cached results and re-run every check')
+    combined_parser.add_argument('--format', choices=['json', 'ndjson'], default='json', dest='output_format', help='Output file format')
+    combined_parser.set_defaults(func=_combined_command)
     
     # Demo command
     demo_parser = subparsers.add_parser('demo', help='Run demonstration')
+    demo_parser.set_defaults(func=_demo_command)
     
     args = parser.parse_args()
     
-    if args.command == 'static':
-        results = run_static_analysis(args.terraform_dir, args.output)
-        print_summary(results)
-        
-    elif args.command == 'policy':
-        results = run_policy_compliance(args.terraform_dir, args.policies, args.output)
-        print_summary(results)
-        
-    elif args.command == 'combined':
-        results = run_combined_analysis(args.terraform_dir, args.policies, args.output)
-        print_summary(results)
-        
-    elif args.command == 'demo':
-        # Import and run demo
-        from demo_phase2 import main as demo_main
-        demo_main()
-        
-    else:
+    global _quiet
+    _quiet = args.quiet
+    
+    # Results piped to another program are not read by people, so drop the
+    # indentation, and keep everything else off stdout
+    output_file = getattr(args, 'output', None)
+    to_stdout = output_file == '-'
+    if output_file and output_file.endswith('.zst') and importlib.util.find_spec('zstandard') is None:
+        parser.error("writing .zst output requires the zstandard package")
+    if to_stdout and not sys.stdout.isatty():
+        args.compact = True
+    
+    if not hasattr(args, 'func'):
         parser.print_help()
+        return
+    
+    with _profiled(args.profile), redirect_stdout(sys.stderr) if to_stdout else nullcontext():
+        # Each subcommand registers its handler; the analysis commands return results
+        results = args.func(args)
+        if results is not None and not args.quiet:
+            print_summary(results)
 
 if __name__ == "__main__":
     main()